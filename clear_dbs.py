@@ -2,7 +2,12 @@ import os
 import glob
 
 db_path = "./instance/"
-db_files = glob.glob(os.path.join(db_path, "*.sqlite"))
+# WAL mode leaves -wal/-shm companions; a stale WAL would be replayed into a new database
+db_files = [
+    db
+    for pattern in ("*.sqlite", "*.sqlite-wal", "*.sqlite-shm")
+    for db in glob.glob(os.path.join(db_path, pattern))
+]
 
 for db in db_files:
     try:
@@ -3,17 +3,17 @@ pragma solidity ^0.8.0;
 
 contract EVoting {
 
+    // Packed layout: positionId, timestamp and voterAdd share one slot (3 slots per vote)
     struct Vote {
-        uint positionId;
+        uint32 positionId;
+        uint64 timestamp;
+        address voterAdd;
         bytes32 voterHash;
         bytes32 candidateHash;
-        uint timestamp;
-        address voterAdd;
     }
     uint256 public startVotingTime;
     uint256 public endVotingTime;
     address public admin;
-    uint public totalVotes;
     Vote[] public votesCast;
 
     constructor() {
@@ -31,17 +31,20 @@ contract EVoting {
     // ✅ NEW: Emit when results are published
     event ResultsPublished(uint timestamp);
 
+    // Emitted for every vote so off-chain indexers can tail the logs
+    event VoteCast(uint indexed positionId, bytes32 indexed voterHash, bytes32 candidateHash, uint timestamp, address voterAdd);
+
     // Candidate registration per position
     mapping(uint => bytes32[]) public positionCandidates;
 
+    // O(1) lookup of registered candidates per position
+    mapping(uint => mapping(bytes32 => bool)) public isCandidate;
+
     // Vote counts per candidate per position
     mapping(uint => mapping(bytes32 => uint)) public voteCounts;
 
-    // Tracks whether a voter has voted per position
-    mapping(uint => mapping(bytes32 => bool)) public hasVoted;
-
-    // Timestamps when voters cast votes
-    mapping(uint => mapping(bytes32 => uint)) public voterTimestamps;
+    // Timestamps when voters cast votes; non-zero also means "has voted"
+    mapping(uint => mapping(bytes32 => uint64)) public voterTimestamps;
 
     function setVotingTime(uint _startVotingTime, uint _endVotingTime) public onlyAdmin {
         require(block.timestamp < _startVotingTime, "Start time must be in future");
@@ -59,28 +62,51 @@ contract EVoting {
     // Admin registers candidates per position (optional)
     function registerCandidate(uint positionId, bytes32 candidateHash) public onlyAdmin {
         positionCandidates[positionId].push(candidateHash);
+        isCandidate[positionId][candidateHash] = true;
+    }
+
+    // Registers many candidates for one position in a single transaction
+    function registerCandidates(uint positionId, bytes32[] calldata candidateHashes) public onlyAdmin {
+        for (uint i = 0; i < candidateHashes.length; i++) {
+            positionCandidates[positionId].push(candidateHashes[i]);
+            isCandidate[positionId][candidateHashes[i]] = true;
+        }
+    }
+
+    // Multi-send: splits msg.value evenly between new voter wallets
+    function fundWallets(address payable[] calldata recipients) public payable onlyAdmin {
+        require(recipients.length > 0, "No recipients");
+        uint share = msg.value / recipients.length;
+        for (uint i = 0; i < recipients.length; i++) {
+            recipients[i].transfer(share);
+        }
     }
 
     function vote(uint positionId, bytes32 voterHash, bytes32 candidateHash) public {
         require(block.timestamp > startVotingTime, "Voting has not started");
         require(block.timestamp < endVotingTime, "Voting has ended");
-        require(!hasVoted[positionId][voterHash], "Already voted for this position");
-
-        // Optional: Enforce that candidate is registered for this position
-        // bool valid = false;
-        // for (uint i = 0; i < positionCandidates[positionId].length; i++) {
-        //     if (positionCandidates[positionId][i] == candidateHash) {
-        //         valid = true;
-        //         break;
-        //     }
-        // }
-        // require(valid, "Candidate not registered for this position");
+        _recordVote(positionId, voterHash, candidateHash);
+    }
+
+    // Casts a whole ballot (one candidate per position) atomically in one transaction
+    function castBallot(uint[] calldata positionIds, bytes32 voterHash, bytes32[] calldata candidateHashes) public {
+        require(block.timestamp > startVotingTime, "Voting has not started");
+        require(block.timestamp < endVotingTime, "Voting has ended");
+        require(positionIds.length == candidateHashes.length, "Ballot length mismatch");
+        for (uint i = 0; i < positionIds.length; i++) {
+            _recordVote(positionIds[i], voterHash, candidateHashes[i]);
+        }
+    }
+
+    function _recordVote(uint positionId, bytes32 voterHash, bytes32 candidateHash) internal {
+        require(voterTimestamps[positionId][voterHash] == 0, "Already voted for this position");
+        require(positionId <= type(uint32).max, "Invalid position");
+        require(isCandidate[positionId][candidateHash], "Candidate not registered for this position");
 
         voteCounts[positionId][candidateHash]++;
-        hasVoted[positionId][voterHash] = true;
-        voterTimestamps[positionId][voterHash] = block.timestamp;
-        totalVotes++;
-        votesCast.push(Vote(positionId, voterHash, candidateHash, block.timestamp, msg.sender));
+        voterTimestamps[positionId][voterHash] = uint64(block.timestamp);
+        votesCast.push(Vote(uint32(positionId), uint64(block.timestamp), msg.sender, voterHash, candidateHash));
+        emit VoteCast(positionId, voterHash, candidateHash, block.timestamp, msg.sender);
     }
 
     function getVoteCounts(uint positionId, bytes32 candidateHash) public view returns (uint) {
@@ -88,10 +114,42 @@ contract EVoting {
         return voteCounts[positionId][candidateHash];
     }
 
+    // Tally of every candidate registered for a position, in registration order
+    function getPositionTally(uint positionId) public view returns (bytes32[] memory candidates, uint[] memory counts) {
+        require(block.timestamp > endVotingTime || msg.sender == admin, "Results not available yet");
+        candidates = positionCandidates[positionId];
+        counts = new uint[](candidates.length);
+        for (uint i = 0; i < candidates.length; i++) {
+            counts[i] = voteCounts[positionId][candidates[i]];
+        }
+    }
+
     function getAllVotes() public view returns (Vote[] memory) {
         return votesCast;
     }
 
+    function getVotesCount() public view returns (uint) {
+        return votesCast.length;
+    }
+
+    // Same count as votesCast.length; no separate counter is stored
+    function totalVotes() public view returns (uint) {
+        return votesCast.length;
+    }
+
+    // Page of votesCast[offset : offset + limit], clamped to the array length
+    function getVotes(uint offset, uint limit) public view returns (Vote[] memory page) {
+        uint total = votesCast.length;
+        if (offset >= total) {
+            return new Vote[](0);
+        }
+        uint end = limit > total - offset ? total : offset + limit;
+        page = new Vote[](end - offset);
+        for (uint i = offset; i < end; i++) {
+            page[i - offset] = votesCast[i];
+        }
+    }
+
     function getCandidates(uint positionId) public view returns (bytes32[] memory) {
         return positionCandidates[positionId];
     }
@@ -121,7 +179,15 @@ contract EVoting {
     }
 
     function hasUserVoted(uint positionId, bytes32 voterHash) public view returns (bool) {
-        return hasVoted[positionId][voterHash];
+        return voterTimestamps[positionId][voterHash] != 0;
+    }
+
+    // Voting status of one voter across many positions in a single call
+    function hasUserVotedBatch(uint[] calldata positionIds, bytes32 voterHash) public view returns (bool[] memory voted) {
+        voted = new bool[](positionIds.length);
+        for (uint i = 0; i < positionIds.length; i++) {
+            voted[i] = voterTimestamps[positionIds[i]][voterHash] != 0;
+        }
     }
 
 
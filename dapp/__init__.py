@@ -4,14 +4,24 @@ import sys
 import os
 
 from flask import Flask
+from flask.helpers import get_debug_flag
 from flask_login import LoginManager
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import inspect
+from sqlalchemy.engine import make_url
 from dotenv import load_dotenv
 from werkzeug.security import generate_password_hash
 from web3 import Web3
 from .cryptography import encrypt_object
 from .ethereum import Blockchain
 from .db import database
+from .schema import upgrade_schema
+from .storage import init_storage, install_sqlite_pragmas
+from .receipt_tracker import receipt_tracker
+from .funding_queue import funding_queue
+from .vote_indexer import vote_indexer
+from .election_config import election_config
+from .nonce_manager import nonce_manager
 from .db_operations import fetch_admin_wallet_address, fetch_contract_address
 
 # Load admin private key from environment variable
@@ -19,14 +29,33 @@ load_dotenv()
 ADMIN_PRIVATE_KEY = os.getenv("ADMIN_PRIVATE_KEY")
 
 
+def is_reloader_parent():
+    """
+    Checks if this process is the file watcher of `flask run` with the
+    auto-reloader on (e.g. FLASK_DEBUG=1). It also calls create_app(), but
+    only its child serves requests, so background workers must not start here.
+
+    Returns:
+        bool: True in the reloader's watcher process.
+    """
+    if os.environ.get("WERKZEUG_RUN_MAIN") == "true":
+        return False  # The reloader's serving child
+    args = sys.argv[1:]
+    if "run" not in args or "--no-reload" in args:
+        return False
+    return "--reload" in args or "--debug" in args or get_debug_flag()
+
+
 def init_candidates(path, db, Candidate):
     """
     Registers candidates from a CSV file to both the blockchain and the local database.
 
-    For each candidate in the CSV file, this function:
-    - Hashes the candidate's name and position.
-    - Registers the candidate on the blockchain using the admin's credentials.
-    - Adds the candidate to the local database if blockchain registration is successful.
+    The function:
+    - Hashes each candidate's name and position.
+    - Registers all candidates on the blockchain in bulk, one pipelined
+      transaction per position chunk, using the admin's credentials.
+    - Adds the candidates whose registration succeeded to the local database
+      with a single commit.
 
     Args:
         path (str): Path to the candidates CSV file.
@@ -42,28 +71,30 @@ def init_candidates(path, db, Candidate):
         csv_reader = csv.reader(csv_file, delimiter=",")
         next(csv_reader)
 
+        rows = {}
         for row in csv_reader:
             candidate_hash = Web3.keccak(text=f"{row[1]}-{row[2]}") # Hashes candidate name and position
-           
-           # Registers a candidate on-chain, signed by admin
-            status, msg = blockchain.register_candidate(
-                ADMIN_PRIVATE_KEY, row[2], candidate_hash
+            rows[(int(row[2]), bytes(candidate_hash))] = (row, candidate_hash)
+
+    # Registers all candidates on-chain, signed by admin
+    registered = blockchain.register_candidates_bulk(ADMIN_PRIVATE_KEY, list(rows))
+
+    # Adds the successfully registered candidates to the database
+    new_candidates = []
+    for key in registered:
+        row, candidate_hash = rows[key]
+        new_candidates.append(
+            Candidate(
+                id=row[0],
+                name=row[1],
+                position_id=row[2],
+                candidate_hash=candidate_hash.hex(),
             )
+        )
+        sys.stdout.write(f' \r Successfully registered candidate {row[1]} \n')
 
-            # sys.stdout.write(f'Candidate {row[1]} registration status: {msg}, candidate_hash: {candidate_hash.hex()} \n')
-            # If the candidate was successfully registered on-chain, add them to the database
-            if status:
-                db.session.add(
-                    Candidate(
-                        id=row[0],
-                        name=row[1],
-                        position_id=row[2],
-                        candidate_hash=candidate_hash.hex(),
-                    )
-                )
-                sys.stdout.write(f' \r Successfully registered candidate {row[1]} \n')
-            
-        db.session.commit()
+    db.session.add_all(new_candidates)
+    db.session.commit()
 
 
 def init_positions(path, db, Position):
@@ -138,18 +169,27 @@ def create_app():
 
     app = Flask(__name__)
     app.config["SECRET_KEY"] = "secret-key"
-    app.config["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{DB_NAME}"
+    init_storage(app, f"sqlite:///{DB_NAME}") # DATABASE_URL overrides the SQLite file
     # app.config["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///:memory:"
-    app.config["EPOCH"] = not os.path.exists(f"{WORKING_DIRECTORY}/instance/{DB_NAME}")
-    print(f"{WORKING_DIRECTORY}/instance/{DB_NAME}")
+    print(make_url(app.config["SQLALCHEMY_DATABASE_URI"]).render_as_string(hide_password=True))
     app.config["SQLALCHEMY_ECHO"] = False
+    # Vote indexer and funding recovery run once, in the process serving requests
+    app.config["BACKGROUND_WORKERS"] = not is_reloader_parent()
 
     database.init_app(app)
+    receipt_tracker.init_app(app)
+    funding_queue.init_app(app)
 
     from . import models
 
     with app.app_context():
+        install_sqlite_pragmas(database.engine) # WAL, busy timeout, cache sizes
+        # First run if the election has not been set up in this database yet
+        app.config["EPOCH"] = not inspect(database.engine).has_table(
+            models.Election.__tablename__
+        )
         database.create_all() # Creates the database tables if they do not exist
+        upgrade_schema() # Adds columns introduced since the database was created
 
         if app.config["EPOCH"]:
             sys.stdout.write("Creating database \n")
@@ -163,6 +203,18 @@ def create_app():
             sys.stdout.write("Database created and admin user added \n")
             sys.stdout.flush()
 
+    # Caches contract address, admin wallet and position count for all requests
+    election_config.init_app(app)
+    # The admin wallet signs for the whole election; keep its nonce in memory
+    nonce_manager.pin(election_config.admin_wallet_address)
+
+    # Starts tailing VoteCast logs once the election is in the database
+    vote_indexer.init_app(app)
+
+    # Requeues wallets whose funding was interrupted by a restart
+    if app.config["BACKGROUND_WORKERS"]:
+        funding_queue.resume()
+
     login_manager = LoginManager()
     login_manager.login_view = "auth.index"
     login_manager.init_app(app)
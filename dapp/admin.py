@@ -1,18 +1,24 @@
 import sys
 
-from flask import Blueprint, flash, redirect, render_template, request, url_for, session
+from flask import Blueprint, flash, jsonify, redirect, render_template, request, url_for, session
 from flask_login import current_user, login_required
 
 from .db_operations import (ban_candidate_by_id, ban_voter_by_id,
-                            fetch_admin_wallet_address, fetch_all_voters,
-                            fetch_contract_address, fetch_election,
+                            fetch_all_voters, fetch_election,
                             fetch_election_result, count_votes_by_voter,
                             fetch_election_result_restricted,
                             fetch_voters_by_candidate_id, publish_result,
                             count_total_votes_cast, count_total_possible_votes,
-                            fetch_all_positions, add_votes, add_results, fetch_all_candidates,
-                            fetch_all_votes, fetch_all_transactions)
+                            fetch_all_positions, add_vote_columns, add_results, fetch_all_candidates,
+                            fetch_all_votes, fetch_all_transactions, fetch_vote_keys)
+from .candidate_registry import candidate_registry
+from .election_config import election_config
+from .credentials import VOTE_INDEXER_ENABLED
 from .ethereum import Blockchain
+from .vote_indexer import vote_indexer
+from .web3_client import client_registry
+from .read_cache import read_cache
+from .single_flight import single_flight
 from .role import ElectionStatus
 from .models import Candidate, Voter, Vote, Result
 from .db import database
@@ -40,8 +46,8 @@ def admin_panel():
 
     # Create a blockchain object
     blockchain = Blockchain(
-        fetch_admin_wallet_address(),
-        fetch_contract_address()
+        election_config.admin_wallet_address,
+        election_config.contract_address
     )
     # Fetch important information
     election = fetch_election()
@@ -62,6 +68,22 @@ def admin_panel():
         ts_to_dt=datetime.utcfromtimestamp
     )
 
+@admin.route('/rpc_stats')
+@login_required
+def rpc_stats():
+    """
+    Returns health statistics of the pooled JSON-RPC endpoints and the view
+    call cache (admin only).
+    """
+    if not is_admin(current_user):
+        return jsonify({"success": False, "message": "Admins only"}), 403
+    return jsonify({
+        "success": True,
+        "endpoints": client_registry.provider_stats(),
+        "read_cache": read_cache.stats(),
+        "coalesced_reads": single_flight.stats(),
+    })
+
 @admin.route('/publish')
 @login_required
 def publish_results():
@@ -76,8 +98,8 @@ def publish_results():
         return redirect(url_for('auth.index'))
     try:
         blockchain = Blockchain( # Create Blockchain object
-            fetch_admin_wallet_address(), 
-            fetch_contract_address()
+            election_config.admin_wallet_address, 
+            election_config.contract_address
         )
         status, tx_receipt = blockchain.publish() # Publish on-chain election results
     except Exception as e:
@@ -87,10 +109,8 @@ def publish_results():
     # If publish successful, fetch election aggregated results and all votes cast
     if status:       
         results = blockchain.group_candidates_by_position() 
-        votes = blockchain.get_all_votes()   
 
         print(f'Fetched results for {len(results)} positions')
-        print(f'Fetched {len(votes)} votes')
         
         try: # Adds aggregated results to local database
             sys.stdout.write('Writing results to database ...   \n')
@@ -98,9 +118,20 @@ def publish_results():
         except Exception as e:
             print(f'Could not enter results: {e}')
             
-        try: # Adds fetched votes to local database
+        try:
             sys.stdout.write('Adding votes to database ...   \n')
-            add_votes(votes)    
+            if VOTE_INDEXER_ENABLED:
+                # Votes are already indexed from VoteCast logs; only catch up
+                vote_indexer.catch_up()
+
+            # The index misses votes cast before its first scanned block (e.g.
+            # enabled mid-election); streams the missing ones page by page
+            onchain_votes = blockchain.get_votes_count()
+            if count_total_votes_cast() != onchain_votes:
+                stored = fetch_vote_keys()
+                for page in blockchain.iter_vote_columns():
+                    add_vote_columns(page, skip_keys=stored)
+            print(f'Stored {count_total_votes_cast()} of {onchain_votes} on-chain votes')
         except Exception as e:
             print(f'Could not enter votes: {e}')
         
@@ -131,6 +162,7 @@ def block_candidate(candidate_id):
         return redirect(url_for('auth.index'))
 
     candidate = ban_candidate_by_id(candidate_id)
+    candidate_registry.invalidate()  # candidate_status is part of the cached ballot
     flash(
         f"Candidate {candidate.name} ({candidate.username}) is {'Unblocked' if candidate.candidate_status else 'Blocked'}"
     )
@@ -181,8 +213,8 @@ def update_time_post():
     print(f'[flask UI] Start time: {start_time}, End time: {end_time}, timezone: {tz}')
 
     blockchain = Blockchain(
-        fetch_admin_wallet_address(),
-        fetch_contract_address()
+        election_config.admin_wallet_address,
+        election_config.contract_address
     )
 
     def show_flash_msg(status, tx_msg):
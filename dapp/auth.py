@@ -221,7 +221,7 @@ def verify_otp_post(username_hash):
     Handles OTP verification for new voter registration.
 
     - Checks the submitted OTP against the stored value.
-    - If correct, completes registration and funds the user's wallet.
+    - If correct, completes registration and queues the user's wallet for funding.
     - If incorrect, prompts the user to try again.
 
     Args:
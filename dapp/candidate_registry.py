@@ -0,0 +1,119 @@
+import threading
+
+from .db_operations import fetch_all_positions, fetch_candidates_by_hashes
+
+
+class CandidateRegistry:
+    """
+    In-process cache of the ballot: position -> ordered candidates.
+
+    Candidates are locked once the election starts, so the on-chain candidate
+    lists and their database rows are loaded once (getCandidates for every
+    position in one concurrent fan-out, plus one IN query) and served from memory afterwards. Rows are
+    stored as plain dicts (Candidate.as_dict()) so they can be shared between
+    requests. The cache is invalidated when a candidate is registered, blocked
+    or unblocked.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._ballot = None  # (by_position, by_hash)
+
+    def _load(self, blockchain):
+        """
+        Builds the position -> candidates mapping from the chain and database.
+
+        Args:
+            blockchain (Blockchain): Any Blockchain view on the election contract.
+
+        Returns:
+            tuple: (position_id -> list of candidate dicts, hash -> candidate dict).
+        """
+        hashes_by_position = blockchain.get_candidates_many(
+            [position.id for position in fetch_all_positions()]
+        )
+        for candidate_hashes in hashes_by_position.values():
+            if isinstance(candidate_hashes, str):  # Error message, don't cache
+                raise Exception(candidate_hashes)
+
+        all_hashes = [h for hashes in hashes_by_position.values() for h in hashes]
+        by_hash = {
+            candidate.candidate_hash: candidate.as_dict()
+            for candidate in fetch_candidates_by_hashes(all_hashes)
+        }
+
+        by_position = {
+            position_id: [by_hash[h] for h in hashes if h in by_hash]
+            for position_id, hashes in hashes_by_position.items()
+        }
+        return by_position, by_hash
+
+    def _ensure_loaded(self, blockchain):
+        """
+        Loads the registry on first use.
+
+        Returns:
+            tuple: (position_id -> list of candidate dicts, hash -> candidate dict).
+        """
+        ballot = self._ballot
+        if ballot is None:
+            with self._lock:
+                if self._ballot is None:
+                    self._ballot = self._load(blockchain)
+                ballot = self._ballot
+        return ballot
+
+    def get_position(self, blockchain, position_id):
+        """
+        Returns the candidates of a position in on-chain registration order.
+
+        Args:
+            blockchain (Blockchain): Used to load the registry if needed.
+            position_id (int): Position ID.
+
+        Returns:
+            list[dict]: Candidate rows as dicts.
+        """
+        by_position, _ = self._ensure_loaded(blockchain)
+        return by_position.get(int(position_id), [])
+
+    def get_by_hash(self, blockchain, candidate_hash):
+        """
+        Returns a registered candidate by hash.
+
+        Args:
+            blockchain (Blockchain): Used to load the registry if needed.
+            candidate_hash (str): The candidate's hash.
+
+        Returns:
+            dict: The candidate row as a dict, or None.
+        """
+        _, by_hash = self._ensure_loaded(blockchain)
+        return by_hash.get(candidate_hash)
+
+    def is_candidate(self, blockchain, position_id, candidate_hash):
+        """
+        Checks that a candidate is registered for a position, without an RPC
+        call once the registry is loaded.
+
+        Args:
+            blockchain (Blockchain): Used to load the registry if needed.
+            position_id (int): Position ID.
+            candidate_hash (str): The candidate's hash.
+
+        Returns:
+            bool: True if the candidate runs for the position.
+        """
+        candidate = self.get_by_hash(blockchain, candidate_hash)
+        return candidate is not None and candidate["position_id"] == int(position_id)
+
+    def invalidate(self):
+        """
+        Drops the cached ballot; the next lookup reloads it.
+        """
+        with self._lock:
+            self._ballot = None
+
+
+# Shared candidate registry for this process
+candidate_registry = CandidateRegistry()
@@ -4,5 +4,74 @@ PASSWORD = "vdfg whpy wdgp pkkx"  # Gmail app password
 # Infura API endpoint
 WEB3_PROVIDER_URL = "https://sepolia.infura.io/v3/eef2b0c98a894b77be8193e5d66deaa9"
 
+# JSON-RPC endpoints pooled by the app (reads go to the fastest healthy one)
+WEB3_PROVIDER_URLS = [
+    WEB3_PROVIDER_URL,
+    "https://ethereum-sepolia-rpc.publicnode.com",
+    "https://rpc.sepolia.org",
+]
+
 # OTP email service
 EMAIL_SERVICE = True
+
+# Max pooled keep-alive connections to the Web3 provider
+WEB3_POOL_SIZE = 20
+
+# Wallets whose next nonce is kept in memory (LRU; pinned wallets are never evicted)
+NONCE_CACHE_SIZE = 1024
+
+# Seconds a cached EIP-1559 fee estimate stays valid (~1 Sepolia block)
+FEE_CACHE_TTL = 12
+
+# Background receipt tracking for asynchronously submitted transactions
+RECEIPT_POLL_INTERVAL = 3  # seconds between receipt polls
+RECEIPT_TIMEOUT = 240  # seconds before a pending tx is reported as timed out
+RECEIPT_MAX_SCAN_BLOCKS = 20  # blocks scanned per poll before falling back to per-hash lookups
+
+# VoteCast log indexer
+VOTE_INDEXER_ENABLED = True
+VOTE_INDEXER_POLL_INTERVAL = 12  # seconds between log scans
+VOTE_INDEXER_BLOCK_RANGE = 2000  # max blocks per eth_getLogs request
+VOTE_INDEXER_CONFIRMATIONS = 6  # trailing blocks re-read to absorb reorgs
+VOTE_INDEXER_START_BLOCK = None  # first block to scan; None = block at first run
+
+# Batched funding of new voter wallets
+FUNDING_BATCH_SIZE = 100  # wallets per fundWallets() transaction
+FUNDING_BATCH_INTERVAL = 15  # seconds to collect signups before a batch is sent
+FUNDING_RECHECK_INTERVAL = 60  # seconds between balance checks of unconfirmed batches
+
+# Simulate every transaction with eth_call ("pending" block) before signing it
+TX_PREFLIGHT = True
+
+# Fee bumping of transactions stuck in the mempool
+TX_BUMP_AFTER_BLOCKS = 3  # blocks without inclusion before a replacement is sent
+TX_MAX_FEE_BUMPS = 3  # replacements per transaction
+TX_FEE_BUMP = 1.125  # fee multiplier per replacement (nodes require >= 1.1)
+
+# Extra multiplier on voter wallet funding for base fee growth before voting
+VOTE_FUNDING_SAFETY_FACTOR = 2
+
+# Multi-endpoint RPC pool
+RPC_REQUEST_TIMEOUT = 10  # seconds per JSON-RPC request
+RPC_LATENCY_ALPHA = 0.2  # weight of the newest sample in the latency average
+RPC_BREAKER_THRESHOLD = 3  # consecutive failures before an endpoint is ejected
+RPC_BREAKER_COOLDOWN = 30  # seconds an ejected endpoint is skipped
+RPC_BROADCAST_FANOUT = 2  # endpoints each raw transaction is sent to
+
+# Block-keyed cache of contract view calls
+READ_CACHE_SIZE = 4096  # max cached results (LRU)
+READ_CACHE_BLOCK_INTERVAL = 12  # seconds between block number polls (~1 Sepolia block)
+READ_CACHE_PATH = None  # e.g. "instance/read_cache.pickle" to persist across restarts
+
+# Concurrent fan-out reads (read_pool)
+READ_POOL_CONCURRENCY = 8  # max eth_calls in flight across all fan-outs
+READ_POOL_TIMEOUT = 60  # seconds a view waits for a fan-out to finish
+
+# Off-chain database (DATABASE_URL in the environment overrides the SQLite file)
+DB_POOL_SIZE = 10  # pooled connections per process
+DB_MAX_OVERFLOW = 20  # extra connections allowed under bursts
+DB_POOL_TIMEOUT = 30  # seconds to wait for a free connection
+DB_POOL_RECYCLE = 1800  # seconds before a pooled connection is replaced
+SQLITE_BUSY_TIMEOUT = 5000  # ms a writer waits for the lock before failing
+SQLITE_CACHE_SIZE = -64000  # page cache per connection (negative = KiB)
+SQLITE_MMAP_SIZE = 268435456  # bytes of the database file memory-mapped
@@ -1,5 +1,6 @@
 from .db import database
-from .models import Candidate, Election, Otp, Vote, Voter, Position, Result, Transaction
+from .models import (Candidate, Election, IndexerCheckpoint, Otp, Vote, Voter,
+                     Position, Result, Transaction)
 from .role import AccountStatus, UserRole
 
 # Retrieve section
@@ -186,6 +187,19 @@ def fetch_candidate_by_hash(candidate_hash):
     return Candidate.query.filter_by(candidate_hash=candidate_hash).first()
 
 
+def fetch_candidates_by_hashes(candidate_hashes):
+    """
+    Retrieves all candidates whose hash is in the given list, in one query.
+
+    Args:
+        candidate_hashes (list[str]): The candidates' hashes.
+
+    Returns:
+        list[Candidate]: The matching candidates.
+    """
+    return Candidate.query.filter(Candidate.candidate_hash.in_(candidate_hashes)).all()
+
+
 def fetch_voter_by_id(voter_id):
     """
     Retrieves a voter by their ID.
@@ -330,6 +344,16 @@ def fetch_all_votes():
     return Vote.query.all()
 
 
+def fetch_vote_keys():
+    """
+    Retrieves the (position_id, voter_hash) key of every stored vote.
+
+    Returns:
+        set[tuple]: Keys of the votes already in the database.
+    """
+    return set(database.session.query(Vote.position_id, Vote.voter_hash).all())
+
+
 def fetch_votes_by_candidate_hash(candidate_hash):
     """
     Retrieves all votes for a specific candidate hash.
@@ -343,6 +367,42 @@ def fetch_votes_by_candidate_hash(candidate_hash):
     return Vote.query.filter_by(candidate_hash=candidate_hash)
 
 
+def fetch_indexer_checkpoint(name):
+    """
+    Retrieves the last indexed block number of a log indexer.
+
+    Args:
+        name (str): The indexer name.
+
+    Returns:
+        int: The checkpoint block number, or None if the indexer never ran.
+    """
+    checkpoint = IndexerCheckpoint.query.filter_by(name=name).first()
+    return checkpoint.block_number if checkpoint else None
+
+
+def fetch_mined_txn_status(txn_hash):
+    """
+    Looks up whether a transaction, or a fee-bumped replacement of it, was
+    logged as mined.
+
+    Args:
+        txn_hash (str): The transaction hash, with or without 0x prefix.
+
+    Returns:
+        bool: The mined transaction's status, or None if none was logged.
+    """
+    bare = txn_hash[2:] if txn_hash.startswith("0x") else txn_hash
+    forms = [bare, f"0x{bare}"]
+    txn = Transaction.query.filter(
+        database.or_(
+            Transaction.txn_hash.in_(forms), Transaction.original_txn_hash.in_(forms)
+        ),
+        Transaction.gas > 0,  # Superseded replacements are logged with no gas
+    ).first()
+    return None if txn is None else bool(txn.status)
+
+
 def fetch_all_transactions():
     """
     Retrieves all blockchain transaction records.
@@ -498,30 +558,124 @@ def add_results(results):
     return True, "Result added successfully."
 
 
-def add_votes(votes):
+def add_vote_columns(columns, skip_keys=None):
     """
-    Adds multiple votes to the database.
+    Adds a decoded page of votes to the database straight from its columns.
+
+    Rows are streamed from the columns into the driver's executemany, so no
+    ORM objects or per-vote mappings are built.
 
     Args:
-        votes (list): List of vote data tuples.
+        columns (VoteColumns): Votes decoded by vote_codec.decode_votes().
+        skip_keys (set): Optional (position_id, voter_hash) keys of votes
+            already stored; those rows are skipped instead of violating
+            uq_vote_position_voter.
 
     Returns:
         tuple: (bool, str) indicating success and a message.
     """
-    new_votes = [
-        Vote(
-            position_id=position_id,
-            voter_hash=voter_hash.hex(),
-            candidate_hash=candidate_hash.hex(),
-            date_time_ts=date_time_ts,
-            wallet_address=wallet_address,
+    if not len(columns):
+        return True, "No votes to add."
+
+    # sqlite3 takes qmark parameters; psycopg2 / MySQL drivers take format
+    placeholder = "?" if database.engine.dialect.paramstyle == "qmark" else "%s"
+    names = ("position_id", "voter_hash", "candidate_hash", "date_time_ts", "wallet_address")
+    values = ", ".join([placeholder] * len(names))
+
+    # Raw SQL skips the ORM-side default of the NOT NULL locked column
+    cursor = database.session.connection().connection.cursor()
+    try:
+        cursor.executemany(
+            f"INSERT INTO {Vote.__table__.name} ({', '.join(names)}, locked) "
+            f"VALUES ({values}, {placeholder})",
+            (
+                row + (False,)
+                for row in columns.iter_rows()
+                if skip_keys is None or (row[0], row[1]) not in skip_keys
+            ),
         )
-        for position_id, voter_hash, candidate_hash, date_time_ts, wallet_address in votes
+    finally:
+        cursor.close()
+    database.session.commit()
+    return True, "Votes added successfully."
+
+
+def upsert_votes(votes):
+    """
+    Inserts or updates votes keyed by (position_id, voter_hash).
+
+    Used by the vote indexer, which may see the same vote again when it
+    re-reads the confirmation window after a reorg.
+
+    Args:
+        votes (list[dict]): Vote column mappings.
+
+    Returns:
+        tuple: (bool, str) indicating success and a message.
+    """
+    if not votes:
+        return True, "No votes to add."
+
+    existing = {
+        (vote.position_id, vote.voter_hash): vote
+        for vote in Vote.query.filter(
+            Vote.voter_hash.in_({vote["voter_hash"] for vote in votes})
+        ).all()
+    }
+    for vote in votes:
+        row = existing.get((vote["position_id"], vote["voter_hash"]))
+        if row is None:
+            row = Vote(**vote)
+            database.session.add(row)
+            existing[(vote["position_id"], vote["voter_hash"])] = row
+        else:
+            for column, value in vote.items():
+                setattr(row, column, value)
+    database.session.commit()
+    return True, "Votes indexed successfully."
+
+
+def delete_reorged_votes(from_block, to_block, seen_keys):
+    """
+    Deletes indexed votes of a re-read block range whose logs did not come back.
+
+    The vote indexer re-reads recent blocks to absorb reorgs; a vote still
+    recorded in that range but missing from the fresh logs was in a block that
+    was reorged out and not re-included.
+
+    Args:
+        from_block (int): First re-read block.
+        to_block (int): Last re-read block.
+        seen_keys (set): (position_id, voter_hash) of the votes found again.
+
+    Returns:
+        int: Number of votes deleted.
+    """
+    phantoms = [
+        vote
+        for vote in Vote.query.filter(Vote.block_number.between(from_block, to_block)).all()
+        if (vote.position_id, vote.voter_hash) not in seen_keys
     ]
+    for vote in phantoms:
+        database.session.delete(vote)
+    database.session.commit()
+    return len(phantoms)
 
-    database.session.add_all(new_votes)
+
+def save_indexer_checkpoint(name, block_number):
+    """
+    Persists the last indexed block number of a log indexer.
+
+    Args:
+        name (str): The indexer name.
+        block_number (int): The last fully indexed block.
+    """
+    checkpoint = IndexerCheckpoint.query.filter_by(name=name).first()
+    if checkpoint is None:
+        checkpoint = IndexerCheckpoint(name=name)
+        database.session.add(checkpoint)
+    checkpoint.block_number = block_number
     database.session.commit()
-    return True, "Vote added successfully."
 
 
 def add_new_vote_record(voter, candidate, vote_hash):
@@ -590,7 +744,7 @@ def add_new_voter_signup(
     database.session.commit()
 
 
-def add_txn(txn_type, txn_hash, status, sender, gas):
+def add_txn(txn_type, txn_hash, status, sender, gas, original_txn_hash=None):
     """
     Adds a new blockchain transaction record to the database.
 
@@ -599,8 +753,17 @@ def add_txn(txn_type, txn_hash, status, sender, gas):
         status (str): The transaction status.
         sender (str): The sender's address.
         gas (int): The gas used for the transaction.
-    """
-    new_txn = Transaction(txn_type=txn_type, txn_hash=txn_hash, status=status, sender=sender, gas=gas)
+        original_txn_hash (str): For a fee-bumped replacement, the hash of the
+            transaction first broadcast for the same request.
+    """
+    new_txn = Transaction(
+        txn_type=txn_type,
+        txn_hash=txn_hash,
+        status=status,
+        sender=sender,
+        gas=gas,
+        original_txn_hash=original_txn_hash,
+    )
     database.session.add(new_txn)
     database.session.commit()
 
@@ -617,7 +780,7 @@ def delete_OTP(otp):
 
 
 def update_voter_wallet_by_username(
-    username_hash, new_wallet_address, new_encrypted_private_key
+    username_hash, new_wallet_address, new_encrypted_private_key, wallet_funded=True
 ):
     """
     Updates a voter's wallet address and encrypted private key.
@@ -626,6 +789,7 @@ def update_voter_wallet_by_username(
         username_hash (str): The voter's username hash.
         new_wallet_address (str): The new wallet address.
         new_encrypted_private_key (str): The new encrypted private key.
+        wallet_funded (bool): False if the wallet still has to be funded.
 
     Returns:
         tuple: (bool, str) indicating success and a message.
@@ -634,6 +798,7 @@ def update_voter_wallet_by_username(
     try:
         voter.wallet_address = new_wallet_address
         voter.private_key_encrypted = new_encrypted_private_key
+        voter.wallet_funded = wallet_funded
         database.session.commit()
         return True, "Wallet info updated successfully"
     except Exception as e:
@@ -641,6 +806,34 @@ def update_voter_wallet_by_username(
         return False, str(e)
 
 
+def fetch_unfunded_voter_wallets():
+    """
+    Retrieves the wallets still waiting in the funding queue.
+
+    Returns:
+        list[tuple]: (username_hash, wallet_address) pairs.
+    """
+    return [
+        (voter.username_hash, voter.wallet_address)
+        for voter in Voter.query.filter(Voter.wallet_funded.is_(False)).all()
+    ]
+
+
+def mark_voter_wallets_funded(username_hashes):
+    """
+    Flags the wallets of the given voters as funded.
+
+    Args:
+        username_hashes (list[str]): The voters' username hashes.
+    """
+    if not username_hashes:
+        return
+    Voter.query.filter(Voter.username_hash.in_(list(username_hashes))).update(
+        {Voter.wallet_funded: True}, synchronize_session=False
+    )
+    database.session.commit()
+
+
 # Publish
 
 
@@ -0,0 +1,103 @@
+import threading
+
+from .db_operations import fetch_admin_wallet_address, fetch_contract_address
+from .models import Position
+from .web3_client import client_registry
+
+
+class ElectionConfigCache:
+    """
+    In-process cache of the election's fixed configuration.
+
+    The contract address, admin wallet and number of positions are written
+    once when the election is set up and do not change while it runs, so they
+    are read from the database at app start instead of on every request. The
+    chain id is read from the node on first use. refresh() reloads everything
+    after an admin operation that changes these values.
+    """
+
+    def __init__(self):
+        self._app = None
+        self._lock = threading.Lock()
+        self._config = None  # (contract_address, admin_wallet_address, position_count)
+        self._chain_id = None
+
+    def init_app(self, app):
+        """
+        Binds the cache to a Flask app and loads the configuration.
+
+        Args:
+            app (Flask): The Flask application.
+        """
+        self._app = app
+        self.refresh()
+
+    def _load(self):
+        """
+        Reads the configuration from the database.
+
+        Returns:
+            tuple: (contract_address, admin_wallet_address, position_count).
+        """
+        with self._app.app_context():
+            return (
+                fetch_contract_address(),
+                fetch_admin_wallet_address(),
+                Position.query.count(),
+            )
+
+    def _ensure_loaded(self):
+        config = self._config
+        if config is None:
+            with self._lock:
+                if self._config is None:
+                    self._config = self._load()
+                config = self._config
+        return config
+
+    def refresh(self):
+        """
+        Reloads the configuration from the database and the node.
+        """
+        config = self._load()
+        with self._lock:
+            self._config = config
+            self._chain_id = None
+
+    @property
+    def contract_address(self):
+        """
+        Returns:
+            str: The election contract address.
+        """
+        return self._ensure_loaded()[0]
+
+    @property
+    def admin_wallet_address(self):
+        """
+        Returns:
+            str: The admin's wallet address.
+        """
+        return self._ensure_loaded()[1]
+
+    @property
+    def position_count(self):
+        """
+        Returns:
+            int: Number of positions on the ballot.
+        """
+        return self._ensure_loaded()[2]
+
+    @property
+    def chain_id(self):
+        """
+        Returns:
+            int: Chain id of the connected network, read from the node once.
+        """
+        if self._chain_id is None:
+            self._chain_id = client_registry.w3.eth.chain_id
+        return self._chain_id
+
+
+# Shared election configuration, loaded in create_app()
+election_config = ElectionConfigCache()
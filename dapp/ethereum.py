@@ -1,22 +1,38 @@
-import json
 import sys
 import os
+import time
 from datetime import datetime, timezone
 from tzlocal import get_localzone
 import pytz
 
 from web3 import Web3
+from web3.exceptions import ContractLogicError, TimeExhausted, TransactionNotFound
 from dotenv import load_dotenv
 from collections import defaultdict
-from .credentials import WEB3_PROVIDER_URL
+from .credentials import (
+    RECEIPT_POLL_INTERVAL,
+    TX_BUMP_AFTER_BLOCKS,
+    TX_FEE_BUMP,
+    TX_MAX_FEE_BUMPS,
+    TX_PREFLIGHT,
+    VOTE_FUNDING_SAFETY_FACTOR,
+)
 from .db_operations import (
     get_offchain_results,
-    add_txn,
     update_voter_wallet_by_username,
-    fetch_admin_wallet_address,
-    fetch_contract_address,
 )
 from .cryptography import encrypt_object
+from .web3_client import client_registry
+from .nonce_manager import nonce_manager
+from .fee_oracle import fee_oracle
+from .receipt_tracker import log_transactions, receipt_tracker
+from .funding_queue import funding_queue
+from .candidate_registry import candidate_registry
+from .election_config import election_config
+from .voting_window import voting_window
+from .read_cache import read_cache
+from .read_pool import read_pool
+from .vote_codec import decode_votes
 from .models import Candidate, Position
 from eth_account import Account
 
@@ -31,44 +47,112 @@ class Blockchain:
     Provides methods for voting, candidate registration, time management, and result publishing.
     """
 
-    _ABI_DIR = f"{os.getcwd()}/contract/ABI.json"
-    sepolia = 11155111
+    # Gas limits per transaction kind
+    _ADMIN_GAS = 200000
+    _VOTE_GAS = 250000
+    _TRANSFER_GAS = 100000
+
+    # Bulk candidate registration: gas per pushed hash and hashes per transaction
+    _REGISTER_GAS_PER_CANDIDATE = 50000
+    _REGISTER_CHUNK_SIZE = 200  # ~10M gas, well under the 30M block gas limit
+
+    # Gas per recipient of a fundWallets() multi-send (new account + transfer)
+    _FUND_GAS_PER_WALLET = 40000
+
+    # Votes fetched per getVotes() call when streaming votesCast
+    _VOTES_PAGE_SIZE = 500
 
     def __init__(self, wallet_address, contract_address):
         """
         Initializes the Blockchain object with wallet and contract addresses.
-        Sets up the Web3 provider and contract instance.
+        The Web3 client and contract instance are shared through the
+        process-wide client registry, so construction is cheap.
 
         Args:
             wallet_address (str): The wallet address to use for transactions.
             contract_address (str): The deployed contract address.
         """
-        self._read_ABI()
         self._wallet_address = wallet_address
         self._contract_address = contract_address
 
-        self.w3 = Web3(Web3.HTTPProvider(WEB3_PROVIDER_URL))
-        self.w3.eth.default_account = self._wallet_address
-
-        self._contract_instance = self.w3.eth.contract(
-            abi=self._ABI, address=self._contract_address
-        )
+        self.w3 = client_registry.w3
+        self._contract_instance = client_registry.contract(self._contract_address)
 
-    def _read_ABI(self):
+    def _call(self, contract_function, transaction=None):
         """
-        Reads the contract ABI from the ABI.json file and loads it for contract interaction.
+        Runs a view call through the block-keyed read cache.
+
+        Args:
+            contract_function (ContractFunction): The bound view call.
+            transaction (dict): Optional call parameters (e.g. {"from": ...}).
+
+        Returns:
+            The decoded return value of the call.
         """
-        with open(self._ABI_DIR) as ABI_file:
-            self._ABI = json.loads(ABI_file.read())
+        return read_cache.call(self.w3, contract_function, transaction)
 
     def _get_nonce(self):
         """
-        Retrieves the current transaction count (nonce) for the wallet address.
+        Allocates the next nonce for the wallet address from the local nonce manager.
+
+        Returns:
+            int: The nonce to use for the next transaction.
+        """
+        return nonce_manager.get_nonce(self.w3, self._wallet_address)
+
+    def _build_tx(self, contract_function, gas, value=0):
+        """
+        Builds an EIP-1559 transaction using the shared fee oracle and nonce manager.
+
+        Args:
+            contract_function (ContractFunction or None): The contract call to
+                encode, or None for a plain transfer (caller sets "to"/"value").
+            gas (int): The transaction gas limit.
+            value (int): Wei sent along with a payable contract call.
 
         Returns:
-            int: The current nonce.
+            dict: The unsigned transaction.
+        """
+        fees = fee_oracle.get_fees(self.w3)
+        tx = {
+            "chainId": election_config.chain_id,
+            "from": self._wallet_address,
+            "gas": gas,
+            "maxFeePerGas": fees["max_fee_per_gas"],
+            "maxPriorityFeePerGas": fees["max_priority_fee_per_gas"],
+            "type": 2,  # EIP-1559 transaction type
+            "nonce": self._get_nonce(),
+        }
+        if value:
+            tx["value"] = value
+        if contract_function is None:
+            return tx
+        try:
+            return contract_function.build_transaction(tx)
+        except Exception:
+            nonce_manager.release(self._wallet_address, tx["nonce"])
+            raise
+
+    def estimate_vote_funding(self, vote_count):
         """
-        return self.w3.eth.get_transaction_count(self._wallet_address, "pending")
+        Estimates the ETH (in wei) a voter wallet needs to cast its votes.
+
+        A node only accepts a transaction if the balance covers
+        gas * maxFeePerGas at signing time, which may be well after funding.
+        The cost at the current max fee is therefore multiplied by
+        TX_FEE_BUMP ** TX_MAX_FEE_BUMPS (so every fee-bumped replacement is
+        still affordable) and by VOTE_FUNDING_SAFETY_FACTOR (base fee growth
+        between funding and voting). The same amount covers one castBallot
+        of vote_count positions, whose gas limit is _VOTE_GAS * vote_count.
+
+        Args:
+            vote_count (int): Number of positions the wallet will vote for.
+
+        Returns:
+            int: Amount in wei covering vote_count votes with fee headroom.
+        """
+        headroom = TX_FEE_BUMP ** TX_MAX_FEE_BUMPS * VOTE_FUNDING_SAFETY_FACTOR
+        return int(fee_oracle.estimate_cost(self.w3, self._VOTE_GAS) * vote_count * headroom)
 
     def local_to_utc_timestamp(self, _timestamp: str) -> int:
         """
@@ -123,21 +207,16 @@ class Blockchain:
         end_ts_utc = self.to_utc_timestamp(end_unix_time, tz)
 
         try:
-            tx = self._contract_instance.functions.setVotingTime(
-                start_ts_utc, end_ts_utc
-            ).build_transaction(
-                {
-                    "chainId": self.sepolia,
-                    "from": self._wallet_address,
-                    "nonce": self._get_nonce(),
-                    "gas": 200000,
-                    "maxFeePerGas": int(self.w3.eth.gas_price * 1.2),
-                    "maxPriorityFeePerGas": self.w3.eth.gas_price // 2,
-                    "type": 2,  # EIP-1559 transaction type
-                }
+            tx = self._build_tx(
+                self._contract_instance.functions.setVotingTime(
+                    start_ts_utc, end_ts_utc
+                ),
+                self._ADMIN_GAS,
             )
             print(f"start time {start_ts_utc}, end time {end_ts_utc} ")
             tx_receipt = self._send_tx('Start election', tx, private_key)
+            if tx_receipt["status"]:
+                voting_window.update(start_ts_utc, end_ts_utc)
             return (bool(tx_receipt["status"]), tx_receipt["transactionHash"].hex())
         except Exception as e:
             return (False, str(e))
@@ -155,20 +234,13 @@ class Blockchain:
         """
         print("[extend_time] Building transaction...")
         try:
-            tx = self._contract_instance.functions.extendVotingTime(
-                new_end_time
-            ).build_transaction(
-                {
-                    "chainId": self.sepolia,
-                    "from": self._wallet_address,
-                    "nonce": self._get_nonce(),
-                    "gas": 200000,
-                    "maxFeePerGas": int(self.w3.eth.gas_price * 1.2),
-                    "maxPriorityFeePerGas": self.w3.eth.gas_price // 2,
-                    "type": 2,  # EIP-1559 transaction type
-                }
+            tx = self._build_tx(
+                self._contract_instance.functions.extendVotingTime(new_end_time),
+                self._ADMIN_GAS,
             )
             tx_receipt = self._send_tx('Extend election', tx, private_key)
+            if tx_receipt["status"]:
+                voting_window.update(end_unix=new_end_time)
             return (bool(tx_receipt["status"]), tx_receipt["transactionHash"].hex())
         except Exception as e:
             return (False, str(e))
@@ -211,7 +283,7 @@ class Blockchain:
             dict: {"start_unix", "end_unix", "start_iso", "end_iso"} or {"error": str}
         """
         try:
-            start_unix, end_unix = self._contract_instance.functions.getVotingTime().call()
+            start_unix, end_unix = self._call(self._contract_instance.functions.getVotingTime())
             start_iso = datetime.fromtimestamp(start_unix, tz=timezone.utc).isoformat()
             end_iso = datetime.fromtimestamp(end_unix, tz=timezone.utc).isoformat()
             return {
@@ -223,15 +295,24 @@ class Blockchain:
         except Exception as e:
             return {"error": str(e)}
 
-    def vote(self, private_key, position_id, voter_hash, candidate_hash):
+    def vote(
+        self, private_key, position_id, voter_hash, candidate_hash,
+        wait=True, on_confirmed=None,
+    ):
         """
         Casts a vote for a candidate in a given position.
 
+        With wait=False the transaction is only signed and broadcast; the
+        receipt is confirmed in the background by the receipt tracker, which
+        logs it and runs on_confirmed once it is mined.
+
         Args:
             private_key (str): Voter's private key.
             position_id (int): Position ID.
             voter_hash (str): Voter's hash.
             candidate_hash (str): Candidate's hash.
+            wait (bool): Block until the receipt is available.
+            on_confirmed (callable): Callback taking the receipt (wait=False only).
 
         Returns:
             tuple: (bool, str) indicating success and transaction hash or error.
@@ -245,26 +326,70 @@ class Blockchain:
               """
         )
         try:
-            tx = self._contract_instance.functions.vote(
-                int(position_id),
-                Web3.to_bytes(hexstr=voter_hash),
-                Web3.to_bytes(hexstr=candidate_hash),
-            ).build_transaction(
-                {
-                    "chainId": self.sepolia,
-                    "from": self._wallet_address,
-                    "nonce": self._get_nonce(),
-                    "gas": 250000,
-                    "maxFeePerGas": int(self.w3.eth.gas_price * 1.2),
-                    "maxPriorityFeePerGas": self.w3.eth.gas_price // 2,
-                    "type": 2,  # EIP-1559 transaction type
-                }
+            # Preflight: the contract would revert on an unregistered candidate
+            if not candidate_registry.is_candidate(self, position_id, candidate_hash):
+                return (False, "Candidate not registered for this position")
+            tx = self._build_tx(
+                self._contract_instance.functions.vote(
+                    int(position_id),
+                    Web3.to_bytes(hexstr=voter_hash),
+                    Web3.to_bytes(hexstr=candidate_hash),
+                ),
+                self._VOTE_GAS,
             )
+            if not wait:
+                tx_hash = Web3.to_hex(self._sign_and_broadcast(tx, private_key))
+                receipt_tracker.track(
+                    'Cast vote', tx_hash, on_confirmed,
+                    replace=lambda: self._bump_fees(tx, private_key),
+                )
+                return (True, tx_hash)
             tx_receipt = self._send_tx('Cast vote', tx, private_key)
             return (bool(tx_receipt["status"]), tx_receipt["transactionHash"].hex())
         except Exception as e:
             return (False, str(e))
 
+    def vote_ballot(self, private_key, voter_hash, selections, wait=True, on_confirmed=None):
+        """
+        Casts a whole ballot (one candidate per position) in a single
+        castBallot() transaction; either every vote lands or none does.
+
+        Args:
+            private_key (str): Voter's private key.
+            voter_hash (str): Voter's hash.
+            selections (list): (position_id, candidate_hash str) pairs.
+            wait (bool): Block until the receipt is available.
+            on_confirmed (callable): Callback taking the receipt (wait=False only).
+
+        Returns:
+            tuple: (bool, str) indicating success and transaction hash or error.
+        """
+        print(f"[vote_ballot] Building transaction for {len(selections)} positions...")
+        try:
+            # Preflight: one unregistered candidate would revert the whole ballot
+            for position_id, candidate_hash in selections:
+                if not candidate_registry.is_candidate(self, position_id, candidate_hash):
+                    return (False, f"Candidate not registered for position {position_id}")
+            tx = self._build_tx(
+                self._contract_instance.functions.castBallot(
+                    [int(position_id) for position_id, _ in selections],
+                    Web3.to_bytes(hexstr=voter_hash),
+                    [Web3.to_bytes(hexstr=candidate_hash) for _, candidate_hash in selections],
+                ),
+                self._VOTE_GAS * len(selections),
+            )
+            if not wait:
+                tx_hash = Web3.to_hex(self._sign_and_broadcast(tx, private_key))
+                receipt_tracker.track(
+                    'Cast ballot', tx_hash, on_confirmed,
+                    replace=lambda: self._bump_fees(tx, private_key),
+                )
+                return (True, tx_hash)
+            tx_receipt = self._send_tx('Cast ballot', tx, private_key)
+            return (bool(tx_receipt["status"]), tx_receipt["transactionHash"].hex())
+        except Exception as e:
+            return (False, str(e))
+
     def register_candidate(self, private_key, position_id, candidate_hash):
         """
         Registers a candidate for a position on the blockchain (admin only).
@@ -279,24 +404,60 @@ class Blockchain:
         """
         print("[register_candidate] Building transaction...")
         try:
-            tx = self._contract_instance.functions.registerCandidate(
-                int(position_id), candidate_hash
-            ).build_transaction(
-                {
-                    "chainId": self.sepolia,
-                    "from": self._wallet_address,
-                    "nonce": self._get_nonce(),
-                    "gas": 200000,
-                    "maxFeePerGas": int(self.w3.eth.gas_price * 1.2),
-                    "maxPriorityFeePerGas": self.w3.eth.gas_price // 2,
-                    "type": 2,  # EIP-1559 transaction type
-                }
+            tx = self._build_tx(
+                self._contract_instance.functions.registerCandidate(
+                    int(position_id), candidate_hash
+                ),
+                self._ADMIN_GAS,
             )
             tx_receipt = self._send_tx('Register candidate', tx, private_key)
+            candidate_registry.invalidate()
             return (bool(tx_receipt["status"]), tx_receipt["transactionHash"].hex())
         except Exception as e:
             return (False, str(e))
 
+    def register_candidates_bulk(self, private_key, candidates):
+        """
+        Registers many candidates with registerCandidates(), grouped by position
+        and chunked to stay under the block gas limit. Chunks are pipelined with
+        consecutive nonces.
+
+        Args:
+            private_key (str): Admin's private key.
+            candidates (list): (position_id, candidate_hash bytes) pairs.
+
+        Returns:
+            list: The (position_id, candidate_hash) pairs registered on-chain.
+        """
+        print("[register_candidates_bulk] Building transactions...")
+        by_position = defaultdict(list)
+        for position_id, candidate_hash in candidates:
+            by_position[int(position_id)].append(candidate_hash)
+
+        chunks = []
+        for position_id, hashes in by_position.items():
+            for start in range(0, len(hashes), self._REGISTER_CHUNK_SIZE):
+                chunks.append((position_id, hashes[start:start + self._REGISTER_CHUNK_SIZE]))
+
+        receipts = self._send_pipelined(
+            'Register candidates',
+            [
+                (
+                    self._contract_instance.functions.registerCandidates(position_id, hashes),
+                    self._ADMIN_GAS + self._REGISTER_GAS_PER_CANDIDATE * len(hashes),
+                )
+                for position_id, hashes in chunks
+            ],
+            private_key,
+        )
+
+        candidate_registry.invalidate()
+        registered = []
+        for (position_id, hashes), tx_receipt in zip(chunks, receipts):
+            if tx_receipt is not None and tx_receipt["status"]:
+                registered.extend((position_id, candidate_hash) for candidate_hash in hashes)
+        return registered
+
     def get_candidates(self, position_id):
         """
         Retrieves all candidate hashes for a given position from the blockchain.
@@ -310,13 +471,25 @@ class Blockchain:
         try:
             return [
                 candidate.hex()
-                for candidate in self._contract_instance.functions.getCandidates(
-                    position_id
-                ).call()
+                for candidate in self._call(
+                    self._contract_instance.functions.getCandidates(position_id)
+                )
             ]
         except Exception as e:
             return f"Error fetching candidates: {str(e)}"
 
+    def get_candidates_many(self, position_ids):
+        """
+        Retrieves the candidate hashes of several positions with concurrent calls.
+
+        Args:
+            position_ids (list[int]): Position IDs.
+
+        Returns:
+            dict: Mapping of position ID to candidate hashes (or error message).
+        """
+        return read_pool.map(self.get_candidates, [int(position_id) for position_id in position_ids])
+
     def print_current_block_timestamp(self):
         """
         Prints the current block timestamp from the contract in UTC.
@@ -325,6 +498,65 @@ class Blockchain:
         dt = datetime.fromtimestamp(timestamp, tz=timezone.utc)
         print(f"Current contract block.timestamp: {timestamp} ({dt.isoformat()})")
 
+    def _preflight(self, tx):
+        """
+        Simulates a transaction with eth_call against the pending block so a
+        call that would revert is rejected before it is signed and paid for.
+
+        Args:
+            tx (dict): The unsigned transaction.
+
+        Raises:
+            Exception: With the decoded revert reason if the call would revert.
+        """
+        call = {key: tx[key] for key in ("from", "to", "data", "value", "gas") if key in tx}
+        try:
+            self.w3.eth.call(call, "pending")
+        except ContractLogicError as e:
+            reason = e.message or str(e)
+            raise Exception(reason.replace("execution reverted: ", "", 1))
+
+    def _sign_and_broadcast(self, tx, private_key):
+        """
+        Signs and broadcasts a transaction, keeping the local nonce in sync.
+        When TX_PREFLIGHT is on, the transaction is first simulated and a
+        reverting one is rejected with its revert reason (its nonce released).
+
+        A node that already holds this exact transaction ("already known")
+        counts as a successful broadcast. On a stale-nonce error the nonce is
+        resynced from the chain and the transaction is retried once with a
+        fresh nonce. On any other failure
+        the nonce is released so it can be reused by the next transaction.
+
+        Args:
+            tx (dict): The transaction dictionary (with nonce).
+            private_key (str): The private key to sign the transaction.
+
+        Returns:
+            HexBytes: The transaction hash.
+        """
+        if TX_PREFLIGHT:
+            try:
+                self._preflight(tx)
+            except Exception:
+                nonce_manager.release(self._wallet_address, tx["nonce"])
+                raise
+
+        for attempt in range(2):
+            signed_tx = self.w3.eth.account.sign_transaction(tx, private_key=private_key)
+            sys.stdout.write(f' \r Sending Tx ... ')
+            try:
+                return self.w3.eth.send_raw_transaction(signed_tx.raw_transaction)
+            except Exception as e:
+                if nonce_manager.is_already_known(e):
+                    return Web3.keccak(signed_tx.raw_transaction)
+                if attempt == 0 and nonce_manager.is_nonce_error(e):
+                    nonce_manager.resync(self.w3, self._wallet_address)
+                    tx["nonce"] = self._get_nonce()
+                    continue
+                nonce_manager.release(self._wallet_address, tx["nonce"])
+                raise
+
     def _send_tx(self, tx_type, tx, private_key):
         """
         Signs and sends a transaction to the blockchain, waits for receipt, and logs it.
@@ -336,25 +568,132 @@ class Blockchain:
         Returns:
             dict: The transaction receipt.
         """
-        sys.stdout.write(f' \r Signing Tx ...{private_key} ')
+        sys.stdout.write(f' \r Signing Tx ... ')
+        tx_hash = self._sign_and_broadcast(tx, private_key)
+        return self._wait_and_log(tx_type, tx, private_key, tx_hash)
+
+    def _bump_fees(self, tx, private_key):
+        """
+        Rebroadcasts a pending transaction with the same nonce and higher fees.
+
+        Both fee caps are raised by at least TX_FEE_BUMP (the minimum increase
+        nodes accept for a replacement) or to the current oracle fees if those
+        are higher. tx is updated in place.
+
+        Args:
+            tx (dict): The transaction as last broadcast.
+            private_key (str): The private key to sign the transaction.
+
+        Returns:
+            HexBytes: The replacement hash, or None if the node refused it
+            because the original was already mined or is still preferred.
+        """
+        fees = fee_oracle.get_fees(self.w3)
+        tx["maxPriorityFeePerGas"] = max(
+            int(tx["maxPriorityFeePerGas"] * TX_FEE_BUMP) + 1,
+            fees["max_priority_fee_per_gas"],
+        )
+        tx["maxFeePerGas"] = max(
+            int(tx["maxFeePerGas"] * TX_FEE_BUMP) + 1,
+            fees["max_fee_per_gas"],
+            tx["maxPriorityFeePerGas"],
+        )
+
         signed_tx = self.w3.eth.account.sign_transaction(tx, private_key=private_key)
-        sys.stdout.write(f' \r Sending Tx ... ')
-        tx_hash = self.w3.eth.send_raw_transaction(signed_tx.raw_transaction)
+        sys.stdout.write(f' \r Replacing Tx (nonce {tx["nonce"]}) ... ')
+        try:
+            return self.w3.eth.send_raw_transaction(signed_tx.raw_transaction)
+        except Exception as e:
+            if nonce_manager.is_already_known(e):
+                return Web3.keccak(signed_tx.raw_transaction)
+            if nonce_manager.is_nonce_error(e):
+                return None
+            raise
+
+    def _wait_and_log(self, tx_type, tx, private_key, tx_hash):
+        """
+        Waits for a broadcast transaction's receipt and logs it off-chain.
+
+        A transaction still not mined after TX_BUMP_AFTER_BLOCKS blocks is
+        replaced with a fee-bumped copy (same nonce), up to TX_MAX_FEE_BUMPS
+        times; whichever copy is mined is returned, and every broadcast hash
+        is logged against the original.
+
+        Args:
+            tx_type (str): Transaction label for the Transaction table.
+            tx (dict): The transaction as broadcast.
+            private_key (str): The private key, used to sign replacements.
+            tx_hash (HexBytes): The transaction hash.
+
+        Returns:
+            dict: The transaction receipt.
+        """
         sys.stdout.write(f' \r Waiting for Tx receipt ... ')
-        tx_receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=240)
-
-        # Log transaction, add to off-chain database
-        add_txn(
-            tx_type,
-            tx_receipt["transactionHash"].hex(),
-            bool(tx_receipt["status"]),
-            tx_receipt["from"],
-            int(tx_receipt["gasUsed"]),
-        )
+        tx_hashes = [tx_hash]
+        bumps = 0
+        last_broadcast_block = self.w3.eth.block_number
+        deadline = time.monotonic() + 240
+        tx_receipt = None
+        while tx_receipt is None:
+            for broadcast_hash in tx_hashes:
+                try:
+                    tx_receipt = self.w3.eth.get_transaction_receipt(broadcast_hash)
+                    break
+                except TransactionNotFound:
+                    continue
+            if tx_receipt is not None:
+                break
+            if time.monotonic() > deadline:
+                raise TimeExhausted(f"Transaction {Web3.to_hex(tx_hash)} not mined after 240 seconds")
+
+            block_number = self.w3.eth.block_number
+            if bumps < TX_MAX_FEE_BUMPS and block_number - last_broadcast_block >= TX_BUMP_AFTER_BLOCKS:
+                bumps += 1
+                last_broadcast_block = block_number
+                replacement = self._bump_fees(tx, private_key)
+                if replacement is not None:
+                    tx_hashes.append(replacement)
+            time.sleep(RECEIPT_POLL_INTERVAL)
+
+        # Log transaction (and any replacements), add to off-chain database
+        log_transactions(tx_type, tx_hashes, tx_receipt)
         sys.stdout.write(f' \r Transaction receipt: {tx_receipt.transactionHash.hex()} ')
         sys.stdout.flush()
         return tx_receipt
 
+    def _send_pipelined(self, tx_type, calls, private_key):
+        """
+        Broadcasts several contract calls back to back with consecutive nonces,
+        then waits for all receipts, so N transactions cost about one block wait.
+
+        Broadcasting stops at the first failure; the remaining calls are not sent.
+
+        Args:
+            tx_type (str): Transaction label for the Transaction table.
+            calls (list): (contract_function, gas) pairs, in nonce order.
+            private_key (str): The private key to sign the transactions.
+
+        Returns:
+            list: One receipt per call, or None for calls that were not mined.
+        """
+        sent = []
+        for contract_function, gas in calls:
+            try:
+                tx = self._build_tx(contract_function, gas)
+                sent.append((tx, self._sign_and_broadcast(tx, private_key)))
+            except Exception as e:
+                print(f"[{tx_type}] Broadcast failed: {e}")
+                break
+
+        receipts = []
+        for tx, tx_hash in sent:
+            try:
+                receipts.append(self._wait_and_log(tx_type, tx, private_key, tx_hash))
+            except Exception as e:
+                print(f"[{tx_type}] No receipt for {Web3.to_hex(tx_hash)}: {e}")
+                receipts.append(None)
+        return receipts + [None] * (len(calls) - len(receipts))
+
     def fund_wallet(self, to_address):
         """
         Sends Ether to a specified address to fund a wallet.
@@ -367,39 +706,111 @@ class Blockchain:
         """
         print("[fund_wallet] Buiding transaction ... ")
         try:
-            # Use Web3.to_wei for ETH to wei conversion
-            estimated_eth = 0.0004  # Estimate: registering a candidate costs ~0.0005 ETH
-            tx = {
-                "to": to_address,
-                "value": self.w3.to_wei(estimated_eth, "ether") * Position.query.count(),  # 0.0005 ETH in wei
-                "gas": 100000,
-                "nonce": self._get_nonce(),
-                "chainId": self.sepolia,
-                "maxFeePerGas": int(self.w3.eth.gas_price * 1.2),
-                "maxPriorityFeePerGas": self.w3.eth.gas_price // 2,
-                "type": 2,  # EIP-1559 transaction type
-            }
-            
+            # Enough ETH for one vote per position at the current max fee
+            value = self.estimate_vote_funding(election_config.position_count)
+            tx = self._build_tx(None, self._TRANSFER_GAS)
+            tx["to"] = to_address
+            tx["value"] = value
+
             tx_receipt = self._send_tx('Fund user wallet', tx, ADMIN_PRIVATE_KEY)
             return (bool(tx_receipt["status"]), tx_receipt["transactionHash"].hex())
         except Exception as e:
             return (False, str(e))
 
+    def get_votes_count(self):
+        """
+        Retrieves the number of votes cast on-chain.
+
+        Returns:
+            int: Total votes stored by the contract.
+        """
+        return self._call(self._contract_instance.functions.getVotesCount())
+
+    def get_position_tally(self, position_id):
+        """
+        Retrieves the vote count of every candidate of a position in one call.
+
+        Args:
+            position_id (int): Position ID.
+
+        Returns:
+            list[tuple]: (candidate_hash bytes, vote_count) pairs in registration order.
+        """
+        candidates, counts = self._call(
+            self._contract_instance.functions.getPositionTally(int(position_id)),
+            {"from": self._wallet_address},
+        )
+        return list(zip(candidates, counts))
+
+    def get_position_tallies(self, position_ids):
+        """
+        Retrieves the tallies of several positions with concurrent calls.
+
+        Args:
+            position_ids (list[int]): Position IDs.
+
+        Returns:
+            dict: Mapping of position ID to (candidate_hash bytes, vote_count) pairs.
+        """
+        return read_pool.map(self.get_position_tally, [int(position_id) for position_id in position_ids])
+
+    def fund_wallets(self, to_addresses):
+        """
+        Funds many new voter wallets in one fundWallets() multi-send transaction.
+
+        (False, msg) means no ETH was sent (the transaction was not broadcast,
+        or it was mined and reverted), so the batch can safely be retried.
+
+        Args:
+            to_addresses (list[str]): The recipients' wallet addresses.
+
+        Returns:
+            tuple: (bool, str) indicating success and transaction hash or error.
+
+        Raises:
+            Exception: If the transaction was broadcast but no receipt was
+                obtained; it may still be mined, so it must not be retried.
+        """
+        print(f"[fund_wallets] Building transaction for {len(to_addresses)} wallets ... ")
+        try:
+            share = self.estimate_vote_funding(election_config.position_count)
+            tx = self._build_tx(
+                self._contract_instance.functions.fundWallets(list(to_addresses)),
+                self._ADMIN_GAS + self._FUND_GAS_PER_WALLET * len(to_addresses),
+                value=share * len(to_addresses),
+            )
+            tx_hash = self._sign_and_broadcast(tx, ADMIN_PRIVATE_KEY)
+        except Exception as e:
+            return (False, str(e))
+
+        tx_receipt = self._wait_and_log('Fund user wallets', tx, ADMIN_PRIVATE_KEY, tx_hash)
+        return (bool(tx_receipt["status"]), tx_receipt["transactionHash"].hex())
+
     def get_onchain_results(self):
         """
-        Retrieves the vote counts for all candidates from the blockchain.
+        Retrieves the vote counts for all candidates from the blockchain,
+        with one tally call per position, made concurrently.
 
         Returns:
             dict: Mapping of candidate IDs to their result data.
         """
+        candidates_by_hash = {
+            bytes(Web3.to_bytes(hexstr=candidate.candidate_hash)): candidate
+            for candidate in Candidate.query.all()
+        }
+
+        positions = Position.query.all()
+        tallies = self.get_position_tallies([position.id for position in positions])
+
         results = {}
-        for candidate in Candidate.query.all():
-            count = self._contract_instance.functions.getVoteCounts(
-                candidate.position_id, Web3.to_bytes(hexstr=candidate.candidate_hash)
-            ).call()
-            results[candidate.id] = candidate.as_dict()
-            results[candidate.id]["vote_count"] = count
-            results[candidate.id]["position"] = candidate.position.position
+        for position in positions:
+            for candidate_hash, count in tallies[position.id]:
+                candidate = candidates_by_hash.get(bytes(candidate_hash))
+                if candidate is None:
+                    continue  # Registered on-chain but unknown off-chain
+                results[candidate.id] = candidate.as_dict()
+                results[candidate.id]["vote_count"] = count
+                results[candidate.id]["position"] = position.position
         # print(f'On-chain results: {results} \n\n')
         return results
 
@@ -425,19 +836,30 @@ class Blockchain:
         print(f"Grouped results {dict(grouped)}")
         return dict(grouped)
 
-    def get_all_votes(self):
+    def iter_vote_columns(self, page_size=None):
         """
-        Retrieves all votes from the blockchain.
+        Streams all votes from the blockchain one page at a time, so memory and
+        eth_call response size stay bounded at any election size. Each page's
+        raw return data is decoded directly into columns (see vote_codec).
 
-        Returns:
-            list or str: List of all votes or error message.
+        Args:
+            page_size (int): Votes per getVotes() call (defaults to VOTES_PAGE_SIZE).
+
+        Yields:
+            VoteColumns: A page of votes.
         """
-        try:
-            all_votes = self._contract_instance.functions.getAllVotes().call()
-            print(f"All votes fetched: {all_votes}")
-            return all_votes
-        except Exception as e:
-            return f"Error fetching all votes: {str(e)}"
+        page_size = page_size or self._VOTES_PAGE_SIZE
+        total = self._contract_instance.functions.getVotesCount().call()
+        for offset in range(0, total, page_size):
+            data = self.w3.eth.call(
+                {
+                    "to": self._contract_instance.address,
+                    "data": self._contract_instance.encode_abi(
+                        "getVotes", args=[offset, page_size]
+                    ),
+                }
+            )
+            yield decode_votes(data)
 
     def publish(self):
         """
@@ -449,16 +871,9 @@ class Blockchain:
         print("[publish] Building transaction ...")
         try:
             # If matched, finalize on-chain
-            tx = self._contract_instance.functions.publishResults().build_transaction(
-                {
-                    "from": self.w3.eth.default_account,
-                    "nonce": self._get_nonce(),
-                    "chainId": self.sepolia,
-                    "gas": 200000,
-                    "maxFeePerGas": int(self.w3.eth.gas_price * 1.2),
-                    "maxPriorityFeePerGas": self.w3.eth.gas_price // 2,
-                    "type": 2,  # EIP-1559 transaction type
-                }
+            tx = self._build_tx(
+                self._contract_instance.functions.publishResults(),
+                self._ADMIN_GAS,
             )
 
             tx_receipt = self._send_tx('Publish result', tx, ADMIN_PRIVATE_KEY)
@@ -479,20 +894,39 @@ class Blockchain:
             bool or tuple: True if voted, False or (False, str) on error.
         """
         try:
-            return self._contract_instance.functions.hasUserVoted(
-                position_id, voter_hash
-            ).call()
+            return self._call(
+                self._contract_instance.functions.hasUserVoted(position_id, voter_hash)
+            )
         except Exception as e:
             return (False, str(e))
 
+    def has_user_voted_batch(self, position_ids, voter_hash):
+        """
+        Checks if a user has voted for each of several positions in one call.
+
+        Args:
+            position_ids (list[int]): Position IDs.
+            voter_hash (bytes): Voter's hash as bytes.
+
+        Returns:
+            dict: Mapping of position ID to bool.
+        """
+        position_ids = [int(position_id) for position_id in position_ids]
+        if not position_ids:
+            return {}
+        voted = self._call(
+            self._contract_instance.functions.hasUserVotedBatch(position_ids, voter_hash)
+        )
+        return dict(zip(position_ids, voted))
+
 
 def fund_new_user_wallet(username_hash):
     """
-    Creates a new wallet for a user, funds it, and updates the user's wallet info in the database.
+    Creates a new wallet for a user and queues it for batched funding. The
+    wallet is saved to the user's row right away, flagged as not funded yet,
+    so a restart resumes the funding instead of losing the wallet.
 
     Args:
-        wallet (str): The admin's wallet address.
-        contract_add (str): The contract address.
         username_hash (str): The user's username hash.
 
     Returns:
@@ -502,39 +936,54 @@ def fund_new_user_wallet(username_hash):
     # Create user wallet
     new_wallet = Account.create()
     address = new_wallet.address
-    private_key = new_wallet.key.hex()
     print(f"New wallet address: {address}")
-    print(f"New wallet private key: {private_key}")
-    
-    user_wallet_update = None
-    e = None
 
-    blockchain = Blockchain(fetch_admin_wallet_address(), fetch_admin_wallet_address())
+    status, e = update_voter_wallet_by_username(
+        username_hash, address, encrypt_object(new_wallet.key.hex()), wallet_funded=False
+    )
+    if not status:
+        return (False, e)
 
-    # Fund wallet address
-    status, msg = blockchain.fund_wallet(address)
+    funding_queue.enqueue(username_hash, address)
+    return (True, "Wallet funding queued")
+    
+def _load_voting_window():
+    """
+    Reads the voting window and the latest block timestamp from the blockchain.
+
+    Returns:
+        tuple: (start_unix, end_unix, block_timestamp).
+    """
+    blockchain = Blockchain(election_config.admin_wallet_address, election_config.contract_address)
+    start_unix, end_unix = blockchain._call(blockchain._contract_instance.functions.getVotingTime())
+    block_timestamp = blockchain.w3.eth.get_block("latest")["timestamp"]
+    return (start_unix, end_unix, block_timestamp)
 
-    if status:  # If wallet successfully funded, update wallet info
-        user_wallet_update, e = update_voter_wallet_by_username(
-            username_hash, address, encrypt_object(private_key)
-        )
 
-    return (user_wallet_update, e)
-    
 def get_voting_time():
         """
-        Retrieves the voting start and end times from the blockchain.
+        Retrieves the voting start and end times, from the voting window cache
+        (read from the blockchain only on the first call).
 
         Returns:
-            dict: Contains start and end times in both unix and readable formats, or error.
+            tuple: (start_unix, end_unix), or (False, str) on error.
         """
-        
-        blockchain = Blockchain(fetch_admin_wallet_address(), fetch_contract_address())
 
         try:
-            start_unix, end_unix = blockchain._contract_instance.functions.getVotingTime().call()
-
-            return (start_unix,end_unix)
+            return voting_window.get(_load_voting_window)
 
         except Exception as e:
-            return (False, str(e))
\ No newline at end of file
+            return (False, str(e))
+
+
+def is_voting_open():
+    """
+    Checks if voting is currently open, without an RPC call once cached.
+
+    Returns:
+        bool: True if the estimated block time is inside the voting window.
+    """
+    try:
+        return voting_window.is_open(_load_voting_window)
+    except Exception:
+        return False
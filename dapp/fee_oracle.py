@@ -0,0 +1,104 @@
+import threading
+import time
+
+from .credentials import FEE_CACHE_TTL
+
+
+class FeeOracle:
+    """
+    Shared EIP-1559 fee estimator backed by eth_feeHistory.
+
+    Fees are fetched with one eth_feeHistory call and reused until the TTL
+    (roughly one block interval) expires, so building a transaction no longer
+    costs extra gas-price round trips. maxPriorityFeePerGas is the median of the
+    chosen reward percentile over the sampled blocks; maxFeePerGas leaves room
+    for the base fee to double before the transaction becomes unincludable.
+    """
+
+    _HISTORY_BLOCKS = 5
+    _REWARD_PERCENTILES = [25, 50, 75]
+    _PRIORITY_PERCENTILE_INDEX = 1  # 50th percentile
+    _MIN_PRIORITY_FEE = 1_000_000  # 0.001 gwei
+
+    def __init__(self, ttl=FEE_CACHE_TTL):
+        """
+        Initializes an empty fee cache.
+
+        Args:
+            ttl (float): Seconds a fee estimate stays valid.
+        """
+        self._ttl = ttl
+        self._lock = threading.Lock()
+        self._estimate = None
+        self._fetched_at = 0.0
+
+    def _fetch(self, w3):
+        """
+        Computes a fresh fee estimate from the node's fee history.
+
+        Args:
+            w3 (Web3): Web3 client used for the lookup.
+
+        Returns:
+            dict: base_fee, max_priority_fee_per_gas, max_fee_per_gas and block.
+        """
+        history = w3.eth.fee_history(
+            self._HISTORY_BLOCKS, "latest", self._REWARD_PERCENTILES
+        )
+        # The last entry is the base fee of the next (pending) block
+        base_fee = int(history["baseFeePerGas"][-1])
+
+        rewards = sorted(
+            int(block_rewards[self._PRIORITY_PERCENTILE_INDEX])
+            for block_rewards in history["reward"]
+        )
+        priority_fee = rewards[len(rewards) // 2] if rewards else 0
+        # Never bid a zero tip, some nodes refuse to propagate it
+        priority_fee = max(priority_fee, self._MIN_PRIORITY_FEE)
+
+        return {
+            "base_fee": base_fee,
+            "max_priority_fee_per_gas": priority_fee,
+            "max_fee_per_gas": 2 * base_fee + priority_fee,
+            "block": int(history["oldestBlock"]) + len(history["baseFeePerGas"]) - 2,
+        }
+
+    def get_fees(self, w3):
+        """
+        Returns the current fee estimate, refreshing it once the TTL expires.
+
+        Args:
+            w3 (Web3): Web3 client used if the cache must be refreshed.
+
+        Returns:
+            dict: base_fee, max_priority_fee_per_gas, max_fee_per_gas and block.
+        """
+        with self._lock:
+            if self._estimate is None or time.monotonic() - self._fetched_at > self._ttl:
+                self._estimate = self._fetch(w3)
+                self._fetched_at = time.monotonic()
+            return dict(self._estimate)
+
+    def estimate_cost(self, w3, gas):
+        """
+        Upper bound (in wei) a sender must hold to pay for a transaction.
+
+        Args:
+            w3 (Web3): Web3 client used if the cache must be refreshed.
+            gas (int): The transaction gas limit.
+
+        Returns:
+            int: gas * maxFeePerGas in wei.
+        """
+        return gas * self.get_fees(w3)["max_fee_per_gas"]
+
+    def invalidate(self):
+        """
+        Forces the next call to fetch fresh fees.
+        """
+        with self._lock:
+            self._estimate = None
+
+
+# Shared fee oracle for every transaction built in this process
+fee_oracle = FeeOracle()
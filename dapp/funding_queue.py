@@ -0,0 +1,233 @@
+import threading
+import time
+
+from .credentials import FUNDING_BATCH_INTERVAL, FUNDING_BATCH_SIZE, FUNDING_RECHECK_INTERVAL
+from .db_operations import fetch_unfunded_voter_wallets, mark_voter_wallets_funded
+from .election_config import election_config
+from .read_pool import read_pool
+from .web3_client import client_registry
+
+
+class FundingQueue:
+    """
+    Collects newly created voter wallets and funds them in batches.
+
+    Signups enqueue their wallet instead of sending one ETH transfer each; a
+    background worker pays up to FUNDING_BATCH_SIZE wallets per fundWallets()
+    multi-send transaction from the admin wallet.
+
+    The wallet is saved on the Voter row with wallet_funded=False before it is
+    queued, and flagged funded once its batch is mined. A batch is requeued
+    right away only when no ETH was sent. If its transaction was broadcast
+    but the outcome is unknown, the wallets are held as unconfirmed and their
+    balances re-checked every FUNDING_RECHECK_INTERVAL seconds: funded ones
+    are flagged, and empty ones are requeued once the admin wallet has no
+    pending transaction left (so the lost one can no longer be mined).
+    resume() puts the wallets left unfunded by a previous run through the
+    same check.
+    """
+
+    def __init__(self, batch_size=FUNDING_BATCH_SIZE, interval=FUNDING_BATCH_INTERVAL,
+                 recheck_interval=FUNDING_RECHECK_INTERVAL):
+        """
+        Initializes an empty queue; call init_app() to bind it to the app.
+
+        Args:
+            batch_size (int): Maximum wallets funded per transaction.
+            interval (float): Seconds to wait for more signups before sending.
+            recheck_interval (float): Seconds between checks of unconfirmed wallets.
+        """
+        self._batch_size = batch_size
+        self._interval = interval
+        self._recheck_interval = recheck_interval
+        self._app = None
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._queue = []
+        self._unconfirmed = []  # Broadcast without a receipt
+        self._recheck_at = 0.0
+        self._thread = None
+
+    def init_app(self, app):
+        """
+        Binds the queue to a Flask app so the worker can use the database.
+
+        Args:
+            app (Flask): The Flask application.
+        """
+        self._app = app
+
+    def resume(self):
+        """
+        Picks up the wallets left unfunded by a previous run.
+
+        They are treated as unconfirmed: wallets that already hold ETH are
+        flagged funded instead of being paid twice, and empty ones are
+        requeued once no admin transaction is pending.
+
+        Must only be called in the process that serves requests, so that
+        two processes never fund the same wallets.
+
+        Returns:
+            int: Number of wallets picked up.
+        """
+        with self._app.app_context():
+            pending = fetch_unfunded_voter_wallets()
+        if not pending:
+            return 0
+
+        print(f"[funding_queue] Resuming {len(pending)} unfunded wallets")
+        with self._lock:
+            self._unconfirmed.extend(pending)
+            self._recheck_at = 0.0  # Check on the worker's first round
+            self._start_worker()
+        return len(pending)
+
+    def enqueue(self, username_hash, wallet_address):
+        """
+        Queues a new voter wallet for funding. The wallet must already be
+        saved on the voter's row with wallet_funded=False.
+
+        Args:
+            username_hash (str): The voter's username hash.
+            wallet_address (str): The new wallet address.
+        """
+        with self._lock:
+            self._queue.append((username_hash, wallet_address))
+            if len(self._queue) >= self._batch_size:
+                self._wakeup.set()
+            self._start_worker()
+
+    def _start_worker(self):
+        """
+        Starts the worker thread if it is not running. Caller holds the lock.
+        """
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(
+                target=self._run, name="funding-queue", daemon=True
+            )
+            self._thread.start()
+
+    def pending_count(self):
+        """
+        Returns the number of wallets waiting to be funded.
+
+        Returns:
+            int: Queue length.
+        """
+        with self._lock:
+            return len(self._queue)
+
+    def _fund_batch(self, batch):
+        """
+        Funds one batch of wallets and flags them funded on success.
+
+        Args:
+            batch (list): (username_hash, wallet_address) entries.
+
+        Returns:
+            bool: True if the batch was funded, False if no ETH was sent.
+
+        Raises:
+            Exception: If the transaction was broadcast but its outcome is unknown.
+        """
+        from .ethereum import Blockchain
+
+        blockchain = Blockchain(election_config.admin_wallet_address, election_config.contract_address)
+        status, msg = blockchain.fund_wallets([address for _, address in batch])
+        if not status:
+            print(f"[funding_queue] Batch of {len(batch)} failed: {msg}")
+            return False
+
+        mark_voter_wallets_funded([username_hash for username_hash, _ in batch])
+        return True
+
+    def _recheck_unconfirmed(self):
+        """
+        Settles unconfirmed wallets from their on-chain balances.
+
+        Wallets holding ETH are flagged funded. If the admin wallet has no
+        pending transaction, nothing can still pay the empty ones, so they
+        are requeued; otherwise they stay unconfirmed for the next check.
+        """
+        with self._lock:
+            entries, self._unconfirmed = self._unconfirmed, []
+            self._recheck_at = time.monotonic() + self._recheck_interval
+        if not entries:
+            return
+
+        try:
+            w3 = client_registry.w3
+            admin = election_config.admin_wallet_address
+            # Read before the balances: a transaction mined in between shows up as funded
+            settled = (
+                w3.eth.get_transaction_count(admin, "pending")
+                == w3.eth.get_transaction_count(admin, "latest")
+            )
+            balances = read_pool.map(w3.eth.get_balance, [address for _, address in entries])
+        except Exception as e:
+            print(f"[funding_queue] Could not check {len(entries)} unconfirmed wallets: {e}")
+            with self._lock:
+                self._unconfirmed[:0] = entries
+            return
+
+        funded = [username_hash for username_hash, address in entries if balances[address] > 0]
+        empty = [entry for entry in entries if balances[entry[1]] == 0]
+        mark_voter_wallets_funded(funded)
+        with self._lock:
+            if settled:
+                self._queue[:0] = empty
+            else:
+                self._unconfirmed[:0] = empty
+        if funded or (settled and empty):
+            print(
+                f"[funding_queue] Unconfirmed wallets: {len(funded)} funded, "
+                f"{len(empty) if settled else 0} requeued"
+            )
+
+    def _run(self):
+        """
+        Worker loop: sends a batch when it is full or the interval elapses,
+        and re-checks unconfirmed wallets every recheck interval.
+        """
+        while True:
+            self._wakeup.wait(self._interval)
+            self._wakeup.clear()
+
+            if self._unconfirmed and time.monotonic() >= self._recheck_at:
+                try:
+                    with self._app.app_context():
+                        self._recheck_unconfirmed()
+                except Exception as e:
+                    # Still flagged unfunded in the database; resume() picks them up
+                    print(f"[funding_queue] Recheck failed: {e}")
+
+            with self._lock:
+                if not self._queue:
+                    if self._unconfirmed:
+                        continue
+                    self._thread = None  # Idle: enqueue() starts a new worker
+                    return
+                batch = self._queue[:self._batch_size]
+                del self._queue[:self._batch_size]
+
+            requeue = False
+            try:
+                with self._app.app_context():
+                    requeue = not self._fund_batch(batch)
+            except Exception as e:
+                # May still be mined: settled from the balances by _recheck_unconfirmed()
+                print(f"[funding_queue] Batch of {len(batch)} outcome unknown, not requeued: {e}")
+                with self._lock:
+                    self._unconfirmed.extend(batch)
+                    self._recheck_at = time.monotonic() + self._recheck_interval
+
+            if requeue:
+                with self._lock:
+                    self._queue[:0] = batch  # Retry first on the next round
+            elif self.pending_count():
+                self._wakeup.set()
+
+
+# Shared funding queue, bound to the app in create_app()
+funding_queue = FundingQueue()
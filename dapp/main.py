@@ -7,12 +7,10 @@ from .db_operations import (
     fetch_all_active_candidates,
     fetch_candidate_by_id,
     fetch_candidate_by_id_restricted,
-    fetch_contract_address,
     fetch_election,
     fetch_election_result,
     fetch_voter_by_id,
     fetch_voters_by_candidate_id,
-    fetch_admin_wallet_address,
     fetch_all_positions,
     fetch_position_by_id,
     fetch_candidate_by_position_id,
@@ -22,7 +20,10 @@ from .db_operations import (
     fetch_vote_by_candidate_id,
     fetch_votes_by_candidate_hash,
 )
-from .ethereum import Blockchain, get_voting_time
+from .candidate_registry import candidate_registry
+from .election_config import election_config
+from .ethereum import Blockchain, get_voting_time, is_voting_open
+from .receipt_tracker import TxStatus, receipt_tracker
 from .role import ElectionStatus
 from .validator import (
     build_vote_cast_hash,
@@ -78,30 +79,20 @@ def positions():
         return redirect(url_for("auth.index"))
 
     # Creates blockchain object using user's wallet address
-    blockchain = Blockchain(current_user.wallet_address, fetch_contract_address())
+    blockchain = Blockchain(current_user.wallet_address, election_config.contract_address)
 
     # Fetches all contested positions
     positions = fetch_all_positions()
 
-    # Dict to keep track of each postion and if user has voted in them
-    has_voted_for_position = {}
-
-    for position in positions:
-        try:
-            # Check if user has voted for this position
-            status = blockchain.has_user_voted(
-                position.id, Web3.to_bytes(hexstr=current_user.username_hash)
-            )
-            # Ensure status is a strict boolean; treat non-boolean (e.g., error tuple) as False
-            if isinstance(status, bool):
-                has_voted_for_position[position.id] = status
-            else:
-                has_voted_for_position[position.id] = False
-        except Exception as e:
-            flash(
-                f"Error checking vote status for position {position.position}: {str(e)}"
-            )
-            has_voted_for_position[position.id] = False
+    # Dict to keep track of each postion and if user has voted in them (one call)
+    try:
+        has_voted_for_position = blockchain.has_user_voted_batch(
+            [position.id for position in positions],
+            Web3.to_bytes(hexstr=current_user.username_hash),
+        )
+    except Exception as e:
+        flash(f"Error checking vote status: {str(e)}")
+        has_voted_for_position = {position.id: False for position in positions}
 
     return render_template(
         "election.html",
@@ -130,7 +121,7 @@ def position(position_id):
         return redirect(url_for("auth.index"))
 
     # Create blockchain object using user's wallet address
-    blockchain = Blockchain(current_user.wallet_address, fetch_contract_address())
+    blockchain = Blockchain(current_user.wallet_address, election_config.contract_address)
 
     status = blockchain.has_user_voted(
         position_id, Web3.to_bytes(hexstr=current_user.username_hash)
@@ -141,12 +132,10 @@ def position(position_id):
 
     # Fetch all candidates contesting for this postion
     position = fetch_position_by_id(position_id)
-    candidates = {}
-    candidate_hashes = blockchain.get_candidates(position_id)
-    # print(f"Candidate hashes for position {position_id}: {candidate_hashes}")
-    for _hash in candidate_hashes:
-        candidates[_hash] = fetch_candidate_by_hash(_hash)
-    # print(f"candidates: {candidates}")
+    candidates = {
+        candidate["candidate_hash"]: candidate
+        for candidate in candidate_registry.get_position(blockchain, position_id)
+    }
 
     # If position or candidates fetch failed
     if not position or not candidates:
@@ -183,7 +172,7 @@ def cast_vote(candidate_id):
     selected_candidate = fetch_candidate_by_id(candidate_id)
 
     # Sending transaction for vote cast
-    blockchain = Blockchain(current_user.wallet_address, fetch_contract_address())
+    blockchain = Blockchain(current_user.wallet_address, election_config.contract_address)
     status, tx_msg = blockchain.vote(
         private_key,
         selected_candidate.position_id,
@@ -272,30 +261,25 @@ def vote():
     if is_admin(current_user):
         return redirect(url_for("auth.index"))
 
-    blockchain = Blockchain(current_user.wallet_address, fetch_contract_address())
+    blockchain = Blockchain(current_user.wallet_address, election_config.contract_address)
 
     positions = fetch_all_positions()
     positions_data = []
-    has_voted_for_position = {}
+
+    # Check vote status on-chain for every position in one call
+    try:
+        has_voted_for_position = blockchain.has_user_voted_batch(
+            [position.id for position in positions],
+            Web3.to_bytes(hexstr=current_user.username_hash),
+        )
+    except Exception:
+        has_voted_for_position = {}
 
     for position in positions:
-        # Check vote status on-chain
-        # try:
-        #     status = blockchain.has_user_voted(
-        #         position.id, Web3.to_bytes(hexstr=current_user.username_hash)
-        #     )
-        #     has_voted_for_position[position.id] = bool(status) if isinstance(status, bool) else False
-        # except Exception:
-        #     has_voted_for_position[position.id] = False
-
-        # Pull candidate hashes from chain and map to DB records
-        candidate_objs = []
+
+        # Blockchain-registered candidates of this position, from the registry cache
         try:
-            candidate_hashes = blockchain.get_candidates(position.id)
-            for _hash in candidate_hashes:
-                candidate = fetch_candidate_by_hash(_hash)
-                if candidate:
-                    candidate_objs.append(candidate)
+            candidate_objs = candidate_registry.get_position(blockchain, position.id)
         except Exception:
             candidate_objs = []
 
@@ -304,7 +288,7 @@ def vote():
                 "id": position.id,
                 "name": position.position,
                 "candidates": candidate_objs,
-                # "has_voted": has_voted_for_position[position.id],
+                "has_voted": has_voted_for_position.get(position.id, False),
             }
         )
 
@@ -334,7 +318,7 @@ def vote():
 #         return jsonify({"success": False, "message": "Invalid payload"}), 400
 
 #     # Prepare for on-chain voting
-#     blockchain = Blockchain(current_user.wallet_address, fetch_contract_address())
+#     blockchain = Blockchain(current_user.wallet_address, election_config.contract_address)
 #     private_key = decrypt_object(current_user.private_key_encrypted)
 
 #     for item in votes:
@@ -377,12 +361,17 @@ def vote():
 def submit_vote():
     """
     Submits a single vote { position_id, candidate_id } and returns JSON status.
-    Intended for step-by-step UI feedback on the client side.
-    Sends a confirmation email to the voter after successful vote submission.
+    The vote is broadcast without waiting for its receipt; the response carries
+    the tx hash with a "pending" status, which the UI polls via /vote_status.
+    A confirmation email is sent to the voter once the vote is mined.
     """
     if is_admin(current_user):
         return jsonify({"success": False, "message": "Admins cannot vote"}), 403
 
+    # Cheap check against the cached voting window before signing anything
+    if not is_voting_open():
+        return jsonify({"success": False, "message": "Voting is not open"}), 403
+
     try:
         data = request.get_json(force=True)
         position_id = int(data.get("position_id"))
@@ -395,41 +384,151 @@ def submit_vote():
     if not candidate:
         return jsonify({"success": False, "message": "Candidate not found"}), 404
 
-    blockchain = Blockchain(current_user.wallet_address, fetch_contract_address())
+    blockchain = Blockchain(current_user.wallet_address, election_config.contract_address)
 
     # Avoid duplicate votes per position
     try:
-        hv = blockchain.has_user_voted(position_id, Web3.to_bytes(hexstr=current_user.username_hash))
-        if isinstance(hv, bool) and hv:
+        hv = blockchain.has_user_voted_batch(
+            [position_id], Web3.to_bytes(hexstr=current_user.username_hash)
+        )
+        if hv.get(position_id):
             return jsonify({"success": True, "message": "Already voted"})
     except Exception:
         pass
 
+    # Captured now: the confirmation email is sent from the receipt tracker thread
+    position = fetch_position_by_id(position_id)
+    receiver_email = current_user.email_encrypted
+    vote_details = [{
+        'position': position.position if position else position_id,
+        'candidate': candidate.name
+    }]
+
+    def send_confirmation(tx_receipt):
+        # Send confirmation email once the vote is mined
+        from .mail_server import MailServer
+        mail_server = MailServer()
+        mail_server.send_vote_confirmation(receiver_email, vote_details)
+
+    # Broadcast only; the receipt is confirmed in the background
     private_key = decrypt_object(current_user.private_key_encrypted)
     ok, msg = blockchain.vote(
         private_key,
         position_id,
         current_user.username_hash,
         candidate.candidate_hash,
+        wait=False,
+        on_confirmed=send_confirmation,
     )
-    
-    if ok:
-        try:
-            # Get position name
-            position = fetch_position_by_id(position_id)
-            
-            # Prepare vote details for email
-            vote_details = [{
-                'position': position.position,
-                'candidate': candidate.name
-            }]
-            
-            # Send confirmation email
-            from .mail_server import MailServer
-            mail_server = MailServer()
-            mail_server.send_vote_confirmation(current_user.email, vote_details)
-        except Exception as e:
-            # Log the error but don't fail the response since the vote was successful
-            print(f"Error sending confirmation email: {str(e)}")
-    
-    return jsonify({"success": bool(ok), "message": msg})
+
+    if not ok:
+        return jsonify({"success": False, "message": msg})
+
+    return jsonify({
+        "success": True,
+        "status": TxStatus.PENDING,
+        "tx_hash": msg,
+        "message": msg,
+    })
+
+
+@main.route("/submit_ballot", methods=["POST"])
+@login_required
+def submit_ballot():
+    """
+    Submits a whole ballot { votes: [{ position_id, candidate_id }, ...] } as a
+    single castBallot transaction and returns JSON status. Positions the voter
+    has already voted for are skipped. Like /submit_vote, the response carries
+    the tx hash with a "pending" status, and one confirmation email listing
+    every vote is sent once the ballot is mined.
+    """
+    if is_admin(current_user):
+        return jsonify({"success": False, "message": "Admins cannot vote"}), 403
+
+    if not is_voting_open():
+        return jsonify({"success": False, "message": "Voting is not open"}), 403
+
+    try:
+        data = request.get_json(force=True)
+        votes = {
+            int(item.get("position_id")): int(item.get("candidate_id"))
+            for item in data.get("votes", [])
+        }
+        if not votes:
+            return jsonify({"success": False, "message": "No votes provided"}), 400
+    except Exception:
+        return jsonify({"success": False, "message": "Invalid payload"}), 400
+
+    # Resolve candidates and make sure each one runs for the given position
+    candidates = {}
+    for position_id, candidate_id in votes.items():
+        candidate = fetch_candidate_by_id(candidate_id)
+        if not candidate or candidate.position_id != position_id:
+            return jsonify({"success": False, "message": f"Candidate {candidate_id} not found"}), 404
+        candidates[position_id] = candidate
+
+    blockchain = Blockchain(current_user.wallet_address, election_config.contract_address)
+
+    # Already-voted positions would revert the whole ballot, so leave them out
+    try:
+        has_voted = blockchain.has_user_voted_batch(
+            list(candidates), Web3.to_bytes(hexstr=current_user.username_hash)
+        )
+        candidates = {
+            position_id: candidate
+            for position_id, candidate in candidates.items()
+            if not has_voted.get(position_id)
+        }
+    except Exception:
+        pass
+    if not candidates:
+        return jsonify({"success": True, "message": "Already voted"})
+
+    # Captured now: the confirmation email is sent from the receipt tracker thread
+    receiver_email = current_user.email_encrypted
+    vote_details = []
+    for position_id, candidate in candidates.items():
+        position = fetch_position_by_id(position_id)
+        vote_details.append({
+            'position': position.position if position else position_id,
+            'candidate': candidate.name
+        })
+
+    def send_confirmation(tx_receipt):
+        # Send one confirmation email for the whole ballot once it is mined
+        from .mail_server import MailServer
+        mail_server = MailServer()
+        mail_server.send_vote_confirmation(receiver_email, vote_details)
+
+    private_key = decrypt_object(current_user.private_key_encrypted)
+    ok, msg = blockchain.vote_ballot(
+        private_key,
+        current_user.username_hash,
+        [(position_id, candidate.candidate_hash) for position_id, candidate in candidates.items()],
+        wait=False,
+        on_confirmed=send_confirmation,
+    )
+
+    if not ok:
+        return jsonify({"success": False, "message": msg})
+
+    return jsonify({
+        "success": True,
+        "status": TxStatus.PENDING,
+        "tx_hash": msg,
+        "message": msg,
+        "position_ids": list(candidates),
+    })
+
+
+@main.route("/vote_status/<tx_hash>")
+@login_required
+def vote_status(tx_hash):
+    """
+    Returns the confirmation status of a vote submitted via /submit_vote or
+    /submit_ballot.
+
+    Args:
+        tx_hash (str): The vote transaction hash.
+    """
+    return jsonify({"tx_hash": tx_hash, "status": receipt_tracker.status(tx_hash)})
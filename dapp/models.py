@@ -34,13 +34,16 @@ class Voter(database.Model, LockableMixin, UserMixin):
     password = database.Column(database.String(88), nullable=False)
 
     wallet_address = database.Column(
-        database.String(42), unique=False, nullable=False, default=""
+        database.String(42), unique=False, nullable=False, default="", index=True
     )
 
     private_key_encrypted = database.Column(
         database.String(88), nullable=False, default=""
     )
 
+    # False while the wallet waits in the funding queue (NULL on older rows = funded)
+    wallet_funded = database.Column(database.Boolean, nullable=True, default=True)
+
     # vote_status = database.Column(
     #     database.Integer,
     #     nullable=False,
@@ -70,7 +73,7 @@ class Candidate(database.Model, LockableMixin):
     name = database.Column(database.String(100), nullable=False)
 
     position_id = database.Column(
-        database.Integer, database.ForeignKey("position.id"), nullable=False
+        database.Integer, database.ForeignKey("position.id"), nullable=False, index=True
     )
 
     vote_count = database.Column(database.Integer, default=0)
@@ -81,6 +84,8 @@ class Candidate(database.Model, LockableMixin):
     candidate_hash = database.Column(
         database.String(66),  # 0x-prefixed hex string of 32 bytes
         nullable=False,
+        unique=True,  # Referenced by Result.candidate_hash
+        index=True,
     )
 
     position = database.relationship("Position", backref="candidates")
@@ -140,15 +145,20 @@ class Election(database.Model, LockableMixin):
 
 
 class Vote(database.Model, LockableMixin):
+    # One vote per voter and position; also serves lookups by position_id
+    __table_args__ = (
+        database.Index("uq_vote_position_voter", "position_id", "voter_hash", unique=True),
+    )
+
     id = database.Column(database.Integer, primary_key=True)
 
     position_id = database.Column(
         database.Integer, database.ForeignKey("position.id"), nullable=False
     )
 
-    voter_hash = database.Column(database.String(66), nullable=False)
+    voter_hash = database.Column(database.String(66), nullable=False, index=True)
 
-    candidate_hash = database.Column(database.String(66), nullable=False)
+    candidate_hash = database.Column(database.String(66), nullable=False, index=True)
 
     date_time_ts = database.Column(
         database.Integer,
@@ -157,6 +167,11 @@ class Vote(database.Model, LockableMixin):
 
     wallet_address = database.Column(database.String(64), nullable=False, unique=False)
 
+    # Block of the VoteCast log, set by the vote indexer (reorg detection)
+    block_number = database.Column(database.Integer, nullable=True, index=True)
+
+    block_hash = database.Column(database.String(66), nullable=True)
+
     position = database.relationship("Position", backref="votes")
 
     def __repr__(self) -> str:
@@ -168,6 +183,7 @@ class Vote(database.Model, LockableMixin):
             candidate_hash: {self.candidate_hash}
             date_time_ts: {self.date_time_ts}
             wallet_address: {self.wallet_address}
+            block_number: {self.block_number}
         )
         """
 
@@ -218,7 +234,12 @@ class Transaction(database.Model, LockableMixin):
 
     gas = database.Column(database.Integer)
 
-    txn_ts = database.Column(database.Integer, nullable=False, default=int(time.time()))
+    txn_ts = database.Column(
+        database.Integer, nullable=False, default=int(time.time()), index=True
+    )
+
+    # Set on fee-bumped replacements: hash of the transaction first broadcast
+    original_txn_hash = database.Column(database.String(66), nullable=True)
 
     def __repr__(self) -> str:
         return f"""
@@ -229,10 +250,28 @@ class Transaction(database.Model, LockableMixin):
                 sender wallet: {self.sender}
                 gas used: {self.gas}
                 transaction timestamp: {self.txn_ts}
+                original transaction hash: {self.original_txn_hash}
             )
             """
 
 
+class IndexerCheckpoint(database.Model, LockableMixin):
+    id = database.Column(database.Integer, primary_key=True)
+
+    name = database.Column(database.String(32), unique=True, nullable=False)
+
+    block_number = database.Column(database.Integer, nullable=False, default=0)
+
+    def __repr__(self) -> str:
+        return f"""
+        IndexerCheckpoint(
+            id: {self.id}
+            name: {self.name}
+            block_number: {self.block_number}
+        )
+        """
+
+
 register_lock_events(Otp)
 register_lock_events(Voter)
 register_lock_events(Candidate)
@@ -241,3 +280,4 @@ register_lock_events(Election)
 register_lock_events(Vote)
 register_lock_events(Result)
 register_lock_events(Transaction)
+register_lock_events(IndexerCheckpoint)
@@ -0,0 +1,164 @@
+import heapq
+import threading
+from collections import OrderedDict
+
+from .credentials import NONCE_CACHE_SIZE
+
+
+class NonceManager:
+    """
+    Hands out transaction nonces from memory for every signing wallet.
+
+    The first nonce for an address is synced from the chain ("pending" count);
+    after that nonces are allocated locally so concurrent transactions from the
+    same wallet never collide and do not cost an RPC round trip. Nonces of
+    transactions that failed to broadcast are released and reissued first, so
+    no gap blocks later transactions in the mempool.
+
+    The chain lookup runs outside the lock, so first transactions from
+    different wallets (every voter wallet sends about one) sync in parallel.
+    Addresses are kept least-recently-used up to max_addresses, except pinned
+    ones (the admin wallet), so voter wallets do not accumulate forever.
+    """
+
+    # Node error fragments meaning the local view of the nonce is stale
+    _NONCE_ERRORS = (
+        "nonce too low",
+        "replacement transaction underpriced",
+        "nonce too high",
+    )
+
+    # Node error fragment meaning this exact signed transaction is already pending
+    _KNOWN_TX_ERROR = "already known"
+
+    def __init__(self, max_addresses=NONCE_CACHE_SIZE):
+        """
+        Args:
+            max_addresses (int): Maximum unpinned addresses kept in memory.
+        """
+        self._max_addresses = max_addresses
+        self._lock = threading.Lock()
+        self._next_nonce = OrderedDict()
+        self._released = {}
+        self._pinned = set()
+
+    def pin(self, address):
+        """
+        Keeps an address in memory regardless of the LRU limit.
+
+        Args:
+            address (str): The wallet address, e.g. the admin's.
+        """
+        with self._lock:
+            self._pinned.add(address)
+
+    def _store(self, address, nonce):
+        """
+        Records the chain's next nonce for an address and evicts the least
+        recently used unpinned addresses beyond the limit. Caller holds the lock.
+        """
+        self._next_nonce[address] = nonce
+        self._next_nonce.move_to_end(address)
+        self._released[address] = []
+
+        unpinned = len(self._next_nonce) - len(self._pinned & self._next_nonce.keys())
+        for stale in list(self._next_nonce):
+            if unpinned <= self._max_addresses:
+                break
+            if stale not in self._pinned:
+                del self._next_nonce[stale]
+                del self._released[stale]
+                unpinned -= 1
+
+    def _allocate(self, address):
+        """
+        Hands out the next nonce of a synced address. Caller holds the lock.
+        """
+        self._next_nonce.move_to_end(address)
+        released = self._released[address]
+        if released:
+            return heapq.heappop(released)
+
+        nonce = self._next_nonce[address]
+        self._next_nonce[address] = nonce + 1
+        return nonce
+
+    def get_nonce(self, w3, address):
+        """
+        Allocates the next nonce for an address.
+
+        Args:
+            w3 (Web3): Web3 client used if the address has not been synced yet.
+            address (str): The wallet address.
+
+        Returns:
+            int: The nonce to use for the next transaction.
+        """
+        with self._lock:
+            if address in self._next_nonce:
+                return self._allocate(address)
+
+        # Not synced yet: read the chain without blocking other wallets
+        chain_nonce = w3.eth.get_transaction_count(address, "pending")
+        with self._lock:
+            if address not in self._next_nonce:  # Another thread may have synced it meanwhile
+                self._store(address, chain_nonce)
+            return self._allocate(address)
+
+    def release(self, address, nonce):
+        """
+        Returns an unused nonce (its transaction was never broadcast).
+
+        Args:
+            address (str): The wallet address.
+            nonce (int): The nonce to give back.
+        """
+        with self._lock:
+            if address not in self._next_nonce:
+                return
+            if nonce == self._next_nonce[address] - 1:
+                self._next_nonce[address] = nonce
+            elif nonce not in self._released[address]:
+                heapq.heappush(self._released[address], nonce)
+
+    def resync(self, w3, address):
+        """
+        Forces the nonce of an address to be reloaded from the chain.
+
+        Args:
+            w3 (Web3): Web3 client used for the lookup.
+            address (str): The wallet address.
+        """
+        chain_nonce = w3.eth.get_transaction_count(address, "pending")
+        with self._lock:
+            self._store(address, chain_nonce)
+
+    def is_nonce_error(self, error):
+        """
+        Checks if a node error means the local nonce is out of sync.
+
+        Args:
+            error (Exception): The error raised while broadcasting.
+
+        Returns:
+            bool: True if the nonce must be resynced from the chain.
+        """
+        message = str(error).lower()
+        return any(fragment in message for fragment in self._NONCE_ERRORS)
+
+    def is_already_known(self, error):
+        """
+        Checks if a node rejected a transaction only because it already holds
+        the same signed transaction; the broadcast then succeeded.
+
+        Args:
+            error (Exception): The error raised while broadcasting.
+
+        Returns:
+            bool: True if the transaction is already in the mempool.
+        """
+        return self._KNOWN_TX_ERROR in str(error).lower()
+
+
+# Shared nonce manager for every wallet signing from this process
+nonce_manager = NonceManager()
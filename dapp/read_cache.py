@@ -0,0 +1,179 @@
+import atexit
+import os
+import pickle
+import threading
+import time
+from collections import OrderedDict
+
+from .credentials import READ_CACHE_BLOCK_INTERVAL, READ_CACHE_PATH, READ_CACHE_SIZE
+from .single_flight import single_flight
+
+
+class BlockReadCache:
+    """
+    Read-through cache of contract view calls, keyed by the latest block.
+
+    A view returns the same answer until a new block is mined, so results are
+    cached under (contract, function, args, caller) for the block number seen
+    when they were read. The latest block number is polled at most once per
+    block interval; as soon as it changes every entry is dropped. Entries are
+    evicted least-recently-used beyond max_entries. Concurrent misses for the
+    same key are coalesced into one eth_call through single_flight.
+
+    With a path set, the cache is written to disk at exit and read back on
+    start; after one block number check, a process restarted within the same
+    block serves its reads from the snapshot instead of repeating every eth_call.
+    """
+
+    def __init__(self, max_entries=READ_CACHE_SIZE, block_interval=READ_CACHE_BLOCK_INTERVAL,
+                 path=READ_CACHE_PATH):
+        """
+        Args:
+            max_entries (int): Maximum number of cached results.
+            block_interval (float): Seconds between block number polls.
+            path (str): File the cache is persisted to, or None.
+        """
+        self._max_entries = max_entries
+        self._block_interval = block_interval
+        self._path = path
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._block = None
+        self._block_checked_at = 0.0
+        self.hits = 0
+        self.misses = 0
+
+        if path is not None:
+            self._load()
+            atexit.register(self.save)
+
+    def latest_block(self, w3):
+        """
+        Returns the latest block number, polled at most once per block interval.
+        Seeing a new block invalidates every cached entry.
+
+        Args:
+            w3 (Web3): Client used to poll the block number.
+
+        Returns:
+            int: The latest known block number.
+        """
+        now = time.monotonic()
+        if self._block is not None and now - self._block_checked_at < self._block_interval:
+            return self._block
+
+        block = w3.eth.block_number
+        with self._lock:
+            self._block_checked_at = now
+            if block != self._block:
+                self._block = block
+                self._entries.clear()
+        return block
+
+    @staticmethod
+    def _key(contract_function, transaction):
+        return (
+            contract_function.address,
+            contract_function.fn_name,
+            repr(contract_function.args),
+            repr(contract_function.kwargs),
+            repr(transaction),
+        )
+
+    def call(self, w3, contract_function, transaction=None):
+        """
+        Returns a view call's result, from the cache when the block is unchanged.
+
+        Args:
+            w3 (Web3): Client used to poll the block number.
+            contract_function (ContractFunction): The bound view call.
+            transaction (dict): Optional call parameters (e.g. {"from": ...}).
+
+        Returns:
+            The decoded return value of the call.
+        """
+        block = self.latest_block(w3)
+        key = self._key(contract_function, transaction)
+
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+
+        # Concurrent misses for the same view and block share one eth_call
+        result = single_flight.do(
+            key + (block,), lambda: contract_function.call(transaction)
+        )
+
+        with self._lock:
+            if block == self._block:  # Skip results read across a block change
+                self._entries[key] = result
+                self._entries.move_to_end(key)
+                while len(self._entries) > self._max_entries:
+                    self._entries.popitem(last=False)
+        return result
+
+    def invalidate(self):
+        """
+        Drops every cached entry.
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        """
+        Returns hit/miss counters and the current size.
+
+        Returns:
+            dict: {"block", "entries", "hits", "misses"}.
+        """
+        with self._lock:
+            return {
+                "block": self._block,
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+    def save(self):
+        """
+        Writes the cache to its path, if one is configured.
+        """
+        if self._path is None:
+            return
+        with self._lock:
+            snapshot = {
+                "block": self._block,
+                "entries": list(self._entries.items()),
+            }
+        try:
+            tmp_path = f"{self._path}.tmp"
+            with open(tmp_path, "wb") as cache_file:
+                pickle.dump(snapshot, cache_file)
+            os.replace(tmp_path, self._path)
+        except Exception as e:
+            print(f"[read_cache] Could not save {self._path}: {e}")
+
+    def _load(self):
+        """
+        Restores a snapshot written by save(). The first read polls the block
+        number as usual, so the entries are only served if no block was mined
+        in between.
+        """
+        if not os.path.exists(self._path):
+            return
+        try:
+            with open(self._path, "rb") as cache_file:
+                snapshot = pickle.load(cache_file)
+        except Exception as e:
+            print(f"[read_cache] Ignoring unreadable {self._path}: {e}")
+            return
+
+        self._block = snapshot["block"]
+        self._entries = OrderedDict(snapshot["entries"][-self._max_entries:])
+
+
+# Shared view-call cache for this process
+read_cache = BlockReadCache()
@@ -0,0 +1,75 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from .credentials import READ_POOL_CONCURRENCY, READ_POOL_TIMEOUT
+
+
+class ReadPool:
+    """
+    Runs independent chain reads concurrently from synchronous Flask views.
+
+    Each read is an ordinary Blockchain view method, so every eth_call still
+    goes through Blockchain._call: the block-keyed read cache, single_flight
+    coalescing, and the RPC pool's per-request endpoint ranking, failover and
+    circuit breakers. The reads run on one shared thread pool of
+    READ_POOL_CONCURRENCY workers, which bounds the eth_calls in flight across
+    all fan-outs, and N reads take about as long as the slowest one instead of
+    the sum of all of them.
+    """
+
+    def __init__(self, max_workers=READ_POOL_CONCURRENCY, timeout=READ_POOL_TIMEOUT):
+        """
+        Args:
+            max_workers (int): Maximum reads running at once.
+            timeout (float): Seconds map() waits for a fan-out to finish.
+        """
+        self._max_workers = max_workers
+        self._timeout = timeout
+        self._lock = threading.Lock()
+        self._executor = None
+
+    def _ensure_executor(self):
+        """
+        Starts the worker threads on first use.
+
+        Returns:
+            ThreadPoolExecutor: The shared executor.
+        """
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self._max_workers, thread_name_prefix="chain-read"
+                    )
+        return self._executor
+
+    def map(self, read, keys):
+        """
+        Runs read(key) for every key concurrently and waits for all of them.
+
+        Must not be called from inside a read, which could exhaust the pool.
+
+        Args:
+            read (callable): Takes one key and returns its result.
+            keys (iterable): The keys to read, e.g. position IDs.
+
+        Returns:
+            dict: Mapping of key to result.
+
+        Raises:
+            Exception: The first exception raised by a read.
+            TimeoutError: If the fan-out takes longer than the timeout.
+        """
+        keys = list(keys)
+        executor = self._ensure_executor()
+        futures = [executor.submit(read, key) for key in keys]
+        deadline = time.monotonic() + self._timeout
+        return {
+            key: future.result(max(0.0, deadline - time.monotonic()))
+            for key, future in zip(keys, futures)
+        }
+
+
+# Shared read pool for this process
+read_pool = ReadPool()
@@ -0,0 +1,320 @@
+import threading
+import time
+from collections import OrderedDict
+
+from hexbytes import HexBytes
+
+from .credentials import (
+    RECEIPT_MAX_SCAN_BLOCKS,
+    RECEIPT_POLL_INTERVAL,
+    RECEIPT_TIMEOUT,
+    TX_BUMP_AFTER_BLOCKS,
+    TX_MAX_FEE_BUMPS,
+)
+from .db_operations import add_txn, fetch_mined_txn_status
+from .read_pool import read_pool
+from .web3_client import client_registry
+
+
+class TxStatus:
+    PENDING = "pending"        # Broadcast, no receipt yet
+    CONFIRMED = "confirmed"    # Mined with status 1
+    FAILED = "failed"          # Mined but reverted
+    TIMEOUT = "timeout"        # No receipt within RECEIPT_TIMEOUT
+    UNKNOWN = "unknown"        # Not tracked here and no receipt found
+
+
+def log_transactions(tx_type, tx_hashes, tx_receipt):
+    """
+    Logs a mined transaction and every fee-bumped replacement of it.
+
+    The first hash is the original request; later hashes are replacements with
+    the same nonce and are recorded against it. Hashes that were not mined are
+    logged as failed with no gas used.
+
+    Args:
+        tx_type (str): Transaction label for the Transaction table.
+        tx_hashes (list): Broadcast hashes, original first.
+        tx_receipt (dict): Receipt of whichever hash was mined.
+    """
+    original = HexBytes(tx_hashes[0])
+    mined = HexBytes(tx_receipt["transactionHash"])
+    for tx_hash in map(HexBytes, tx_hashes):
+        add_txn(
+            tx_type,
+            tx_hash.hex(),
+            bool(tx_receipt["status"]) if tx_hash == mined else False,
+            tx_receipt["from"],
+            int(tx_receipt["gasUsed"]) if tx_hash == mined else 0,
+            original_txn_hash=None if tx_hash == original else original.hex(),
+        )
+
+
+class ReceiptTracker:
+    """
+    Background tracker confirming broadcast transactions off the request thread.
+
+    Routes broadcast a transaction, register its hash here and return at once.
+    A daemon thread polls for receipts, logs each mined transaction to the
+    off-chain database and runs the caller's confirmation callback inside the
+    Flask application context. A transaction still not mined after
+    TX_BUMP_AFTER_BLOCKS blocks is replaced through the caller's replace
+    callback (same nonce, bumped fees), up to TX_MAX_FEE_BUMPS times; its
+    status stays available under the original hash.
+
+    Each poll fetches the blocks mined since the previous one (hashes only)
+    and asks for receipts only of the pending transactions found in them, so
+    a poll costs about one request per block however many transactions are
+    pending. A newly tracked transaction gets one direct receipt lookup, in
+    case it was mined before the scan reached it; those lookups, and all of
+    them when more than RECEIPT_MAX_SCAN_BLOCKS blocks were missed, run
+    concurrently through read_pool.
+    """
+
+    _MAX_FINISHED = 10000  # Finished entries kept for status lookups
+
+    def __init__(self, poll_interval=RECEIPT_POLL_INTERVAL, timeout=RECEIPT_TIMEOUT):
+        """
+        Initializes an idle tracker; call init_app() to bind it to the app.
+
+        Args:
+            poll_interval (float): Seconds between receipt polls.
+            timeout (float): Seconds after which a pending tx is given up on.
+        """
+        self._poll_interval = poll_interval
+        self._timeout = timeout
+        self._app = None
+        self._lock = threading.Lock()
+        self._pending = {}
+        self._finished = OrderedDict()
+        self._scanned_block = None  # Last block whose transactions were matched
+        self._thread = None
+
+    def init_app(self, app):
+        """
+        Binds the tracker to a Flask app so callbacks can use the database.
+
+        Args:
+            app (Flask): The Flask application.
+        """
+        self._app = app
+
+    def _ensure_worker(self):
+        """
+        Starts the polling thread if it is not already running.
+        """
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(
+                target=self._run, name="receipt-tracker", daemon=True
+            )
+            self._thread.start()
+
+    def track(self, tx_type, tx_hash, on_confirmed=None, replace=None):
+        """
+        Registers a broadcast transaction for background confirmation.
+
+        Args:
+            tx_type (str): Transaction label written to the Transaction table.
+            tx_hash (str): The transaction hash (hex).
+            on_confirmed (callable): Optional callback taking the receipt,
+                run once the transaction is mined successfully.
+            replace (callable): Optional callback rebroadcasting the transaction
+                with bumped fees; returns the new hash or None.
+        """
+        with self._lock:
+            self._pending[tx_hash] = {
+                "tx_type": tx_type,
+                "on_confirmed": on_confirmed,
+                "replace": replace,
+                "tx_hashes": [tx_hash],
+                "bumps": 0,
+                "last_broadcast_block": None,
+                "submitted_at": time.monotonic(),
+                "checked": False,  # Direct receipt lookup done
+            }
+            self._ensure_worker()
+
+    def status(self, tx_hash):
+        """
+        Returns the confirmation status of a transaction.
+
+        Transactions not held in this process's memory (tracked by another
+        worker, before a restart, or evicted) and timed-out ones are looked up
+        in the Transaction table, which also covers mined fee-bumped
+        replacements, and then on the chain. Must be called inside an
+        application context.
+
+        Args:
+            tx_hash (str): The transaction hash (hex).
+
+        Returns:
+            str: One of the TxStatus values.
+        """
+        with self._lock:
+            if tx_hash in self._pending:
+                return TxStatus.PENDING
+            status = self._finished.get(tx_hash, TxStatus.UNKNOWN)
+        if status not in (TxStatus.UNKNOWN, TxStatus.TIMEOUT):
+            return status
+
+        mined = fetch_mined_txn_status(tx_hash)
+        if mined is None:
+            try:
+                mined = bool(client_registry.w3.eth.get_transaction_receipt(tx_hash)["status"])
+            except Exception:
+                return status  # Not mined (yet), or the node is unreachable
+        return TxStatus.CONFIRMED if mined else TxStatus.FAILED
+
+    def _finish(self, tx_hash, status):
+        """
+        Moves a transaction from pending to finished with its final status.
+        """
+        with self._lock:
+            self._pending.pop(tx_hash, None)
+            self._finished[tx_hash] = status
+            while len(self._finished) > self._MAX_FINISHED:
+                self._finished.popitem(last=False)
+
+    def _handle_receipt(self, tx_hash, entry, tx_receipt):
+        """
+        Logs a mined transaction and runs its confirmation callback.
+        """
+        status = bool(tx_receipt["status"])
+        with self._app.app_context():
+            try:
+                log_transactions(entry["tx_type"], entry["tx_hashes"], tx_receipt)
+            except Exception as e:
+                print(f"[receipt_tracker] Could not log {tx_hash}: {e}")
+
+            if status and entry["on_confirmed"]:
+                try:
+                    entry["on_confirmed"](tx_receipt)
+                except Exception as e:
+                    print(f"[receipt_tracker] Callback failed for {tx_hash}: {e}")
+
+        self._finish(tx_hash, TxStatus.CONFIRMED if status else TxStatus.FAILED)
+
+    def _find_receipt(self, tx_hashes):
+        """
+        Returns the receipt of whichever broadcast hash was mined, if any.
+        """
+        for tx_hash in tx_hashes:
+            try:
+                return client_registry.w3.eth.get_transaction_receipt(tx_hash)
+            except Exception:
+                continue  # Not mined yet (or transient RPC error)
+        return None
+
+    def _mined_hashes(self, block_number):
+        """
+        Returns the hashes of the transactions mined since the last scan.
+
+        Advances the scan position block by block; a block that cannot be read
+        is retried on the next poll. Returns None when more than
+        RECEIPT_MAX_SCAN_BLOCKS blocks were missed (or on the first poll): the
+        scan then restarts at block_number and every pending transaction needs
+        a direct lookup.
+
+        Args:
+            block_number (int): The latest block number.
+
+        Returns:
+            set or None: Mined transaction hashes (HexBytes).
+        """
+        if (
+            self._scanned_block is None
+            or block_number - self._scanned_block > RECEIPT_MAX_SCAN_BLOCKS
+        ):
+            self._scanned_block = block_number
+            return None
+
+        mined = set()
+        for number in range(self._scanned_block + 1, block_number + 1):
+            try:
+                block = client_registry.w3.eth.get_block(number)
+            except Exception:
+                break
+            mined.update(map(HexBytes, block["transactions"]))
+            self._scanned_block = number
+        return mined
+
+    def _maybe_replace(self, entry, block_number):
+        """
+        Rebroadcasts a stuck transaction with bumped fees once enough blocks passed.
+        """
+        if entry["last_broadcast_block"] is None:
+            entry["last_broadcast_block"] = block_number
+            return
+        if (
+            entry["replace"] is None
+            or entry["bumps"] >= TX_MAX_FEE_BUMPS
+            or block_number - entry["last_broadcast_block"] < TX_BUMP_AFTER_BLOCKS
+        ):
+            return
+
+        entry["bumps"] += 1
+        entry["last_broadcast_block"] = block_number
+        try:
+            new_hash = entry["replace"]()
+        except Exception as e:
+            print(f"[receipt_tracker] Replacement failed for {entry['tx_hashes'][0]}: {e}")
+            return
+        if new_hash is not None:
+            entry["tx_hashes"].append(new_hash)
+
+    def _run(self):
+        """
+        Polling loop: matches pending transactions against the newly mined
+        blocks and fetches the receipts of those found.
+        """
+        while True:
+            with self._lock:
+                if not self._pending:
+                    self._thread = None  # Idle: track() starts a new worker
+                    return
+                pending = list(self._pending.items())
+
+            try:
+                block_number = client_registry.w3.eth.block_number
+                mined = self._mined_hashes(block_number)
+            except Exception:
+                block_number, mined = None, None
+
+            # Receipts are fetched for transactions seen in the new blocks, for
+            # new entries, and for all of them when the scan restarted
+            matched = {
+                tx_hash for tx_hash, entry in pending
+                if mined is not None and any(HexBytes(h) in mined for h in entry["tx_hashes"])
+            }
+            lookups = {
+                tx_hash: list(entry["tx_hashes"])
+                for tx_hash, entry in pending
+                if mined is None or not entry["checked"] or tx_hash in matched
+            }
+            try:
+                receipts = read_pool.map(
+                    lambda tx_hash: self._find_receipt(lookups[tx_hash]), lookups
+                )
+            except Exception as e:
+                print(f"[receipt_tracker] Receipt lookups failed: {e}")
+                receipts = {}
+
+            for tx_hash, entry in pending:
+                tx_receipt = receipts.get(tx_hash)
+                if tx_hash in receipts:
+                    # Later blocks are covered by the scan; a receipt missing
+                    # despite a match (RPC error, reorg) is looked up again
+                    entry["checked"] = block_number is not None and tx_hash not in matched
+
+                if tx_receipt is not None:
+                    self._handle_receipt(tx_hash, entry, tx_receipt)
+                elif time.monotonic() - entry["submitted_at"] > self._timeout:
+                    self._finish(tx_hash, TxStatus.TIMEOUT)
+                elif block_number is not None:
+                    self._maybe_replace(entry, block_number)
+
+            time.sleep(self._poll_interval)
+
+
+# Shared receipt tracker, bound to the app in create_app()
+receipt_tracker = ReceiptTracker()
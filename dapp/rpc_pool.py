@@ -0,0 +1,329 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from web3 import Web3
+from web3.providers import JSONBaseProvider
+
+from .credentials import (
+    RPC_BREAKER_COOLDOWN,
+    RPC_BREAKER_THRESHOLD,
+    RPC_BROADCAST_FANOUT,
+    RPC_LATENCY_ALPHA,
+    RPC_REQUEST_TIMEOUT,
+    WEB3_POOL_SIZE,
+)
+
+
+class RPCEndpoint:
+    """
+    One JSON-RPC endpoint of the pool with its health statistics.
+
+    Latency is tracked as an exponentially weighted moving average. After
+    RPC_BREAKER_THRESHOLD consecutive failures the circuit breaker opens and
+    the endpoint is skipped for RPC_BREAKER_COOLDOWN seconds. After that the
+    breaker is half-open: a single trial request is let through, which closes
+    the breaker on success or reopens it on failure, and the endpoint is
+    skipped by other requests while the trial is in flight.
+    """
+
+    def __init__(self, url, pool_size, timeout):
+        """
+        Args:
+            url (str): JSON-RPC endpoint URL.
+            pool_size (int): Maximum number of pooled keep-alive connections.
+            timeout (float): Per-request timeout in seconds.
+        """
+        self.url = url
+        self.provider = Web3.HTTPProvider(
+            url,
+            request_kwargs={"timeout": timeout},
+            session=self._build_session(pool_size),
+            exception_retry_configuration=None,  # The pool fails over instead
+        )
+        self.latency = None  # EWMA, seconds
+        self.requests = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.opened_at = None
+        self.trial_in_flight = False
+
+    @staticmethod
+    def _build_session(pool_size):
+        """
+        Creates a requests session with a connection pool sized for the workers.
+
+        Returns:
+            requests.Session: The pooled HTTP session.
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    @property
+    def name(self):
+        """
+        Returns the endpoint without its path, so API keys are not exposed.
+        """
+        parts = urlsplit(self.url)
+        return f"{parts.scheme}://{parts.netloc}"
+
+    def state(self, now):
+        """
+        Returns the circuit breaker state: "closed", "open" or "half-open".
+        """
+        if self.opened_at is None:
+            return "closed"
+        if now - self.opened_at < RPC_BREAKER_COOLDOWN:
+            return "open"
+        return "half-open"
+
+
+class _TrialInFlight(Exception):
+    """
+    Raised when a half-open endpoint is already serving its trial request.
+    """
+
+
+class MultiEndpointProvider(JSONBaseProvider):
+    """
+    Web3 provider spreading requests over several JSON-RPC endpoints.
+
+    Reads go to the available endpoint with the lowest latency average and
+    fail over to the next one on connection errors, timeouts, HTTP errors and
+    rate limiting. Raw transactions are broadcast to the RPC_BROADCAST_FANOUT
+    best endpoints in parallel, so one lagging node does not delay inclusion.
+    JSON-RPC error responses (reverts, nonce errors...) are returned as they
+    are and do not count against the endpoint.
+    """
+
+    _BROADCAST_METHODS = {"eth_sendRawTransaction"}
+
+    def __init__(self, urls, pool_size=WEB3_POOL_SIZE, timeout=RPC_REQUEST_TIMEOUT,
+                 fanout=RPC_BROADCAST_FANOUT):
+        """
+        Args:
+            urls (list): JSON-RPC endpoint URLs, in order of preference.
+            pool_size (int): Keep-alive connections per endpoint.
+            timeout (float): Per-request timeout in seconds.
+            fanout (int): Number of endpoints a raw transaction is sent to.
+        """
+        super().__init__()
+        if not urls:
+            raise ValueError("At least one JSON-RPC endpoint is required")
+        self._endpoints = [RPCEndpoint(url, pool_size, timeout) for url in urls]
+        self._fanout = max(1, min(fanout, len(self._endpoints)))
+        self._lock = threading.Lock()
+        # Each of up to pool_size concurrent broadcasts fans out to fanout endpoints
+        self._broadcaster = ThreadPoolExecutor(
+            max_workers=pool_size * self._fanout, thread_name_prefix="rpc-broadcast"
+        )
+
+    def _ranked_endpoints(self):
+        """
+        Orders endpoints for the next request.
+
+        Available endpoints (breaker closed, or half-open with no trial in
+        flight) come first, fastest first; endpoints not measured yet rank
+        first so they get probed. If none is available, all endpoints are
+        tried, oldest-opened first.
+
+        Returns:
+            list[RPCEndpoint]: Endpoints in the order they should be tried.
+        """
+        now = time.monotonic()
+        with self._lock:
+            available = [
+                e for e in self._endpoints
+                if e.state(now) == "closed"
+                or (e.state(now) == "half-open" and not e.trial_in_flight)
+            ]
+            if available:
+                return sorted(
+                    available, key=lambda e: e.latency if e.latency is not None else 0.0
+                )
+            return sorted(self._endpoints, key=lambda e: e.opened_at)
+
+    def _claim(self, endpoint):
+        """
+        Reserves the trial request of a half-open endpoint.
+
+        Returns:
+            bool: False if the endpoint is half-open and its trial is taken.
+        """
+        with self._lock:
+            if endpoint.state(time.monotonic()) != "half-open":
+                return True
+            if endpoint.trial_in_flight:
+                return False
+            endpoint.trial_in_flight = True
+            return True
+
+    def _record_success(self, endpoint, elapsed):
+        with self._lock:
+            endpoint.trial_in_flight = False
+            endpoint.requests += 1
+            endpoint.consecutive_failures = 0
+            endpoint.opened_at = None
+            if endpoint.latency is None:
+                endpoint.latency = elapsed
+            else:
+                endpoint.latency += RPC_LATENCY_ALPHA * (elapsed - endpoint.latency)
+
+    def _record_failure(self, endpoint):
+        with self._lock:
+            endpoint.trial_in_flight = False
+            endpoint.requests += 1
+            endpoint.failures += 1
+            endpoint.consecutive_failures += 1
+            now = time.monotonic()
+            if (
+                endpoint.consecutive_failures >= RPC_BREAKER_THRESHOLD
+                or endpoint.state(now) == "half-open"
+            ):
+                endpoint.opened_at = now
+
+    @staticmethod
+    def _is_rate_limited(response):
+        """
+        Checks for a rate-limit error, which some providers return as JSON-RPC.
+        """
+        error = response.get("error")
+        if not isinstance(error, dict):
+            return False
+        return error.get("code") == -32005 or "rate limit" in str(error.get("message", "")).lower()
+
+    def _request(self, endpoint, method, params):
+        """
+        Sends one request to one endpoint and updates its statistics.
+
+        Raises:
+            _TrialInFlight: If the endpoint is half-open and busy with its trial.
+            Exception: If the endpoint failed (network, HTTP or rate limit).
+        """
+        if not self._claim(endpoint):
+            raise _TrialInFlight(f"{endpoint.name} trial request in flight")
+        started = time.monotonic()
+        try:
+            response = endpoint.provider.make_request(method, params)
+        except Exception:
+            self._record_failure(endpoint)
+            raise
+        if self._is_rate_limited(response):
+            self._record_failure(endpoint)
+            raise Exception(f"{endpoint.name} rate limited: {response['error']}")
+        self._record_success(endpoint, time.monotonic() - started)
+        return response
+
+    def _read(self, method, params):
+        """
+        Sends a request to the best endpoint, failing over on endpoint errors.
+        """
+        last_error = None
+        for endpoint in self._ranked_endpoints():
+            try:
+                return self._request(endpoint, method, params)
+            except _TrialInFlight as e:
+                last_error = e
+            except Exception as e:
+                print(f"[rpc_pool] {method} failed on {endpoint.name}: {e}")
+                last_error = e
+        raise last_error
+
+    def _broadcast(self, method, params):
+        """
+        Sends a raw transaction to several endpoints at once.
+
+        Returns the first accepted response. If no endpoint accepts it, the
+        first error response is returned, or the last exception raised.
+        """
+        endpoints = self._ranked_endpoints()
+        futures = [
+            self._broadcaster.submit(self._request, endpoint, method, params)
+            for endpoint in endpoints[:self._fanout]
+        ]
+
+        error_response, last_error = None, None
+        for future in as_completed(futures):
+            try:
+                response = future.result()
+            except Exception as e:
+                last_error = e
+                continue
+            if "error" not in response:
+                return response
+            error_response = error_response or response
+
+        if error_response is not None:
+            return error_response
+        # Every broadcast endpoint failed: fall back to the remaining ones
+        for endpoint in endpoints[self._fanout:]:
+            try:
+                return self._request(endpoint, method, params)
+            except Exception as e:
+                last_error = e
+        raise last_error
+
+    def make_request(self, method, params):
+        """
+        Routes a JSON-RPC request: broadcasts raw transactions, reads otherwise.
+        """
+        if method not in self._BROADCAST_METHODS:
+            return self._read(method, params)
+        if self._fanout > 1:
+            response = self._broadcast(method, params)
+        else:
+            response = self._read(method, params)
+        return self._accept_known(response, params)
+
+    @staticmethod
+    def _accept_known(response, params):
+        """
+        Turns an "already known" rejection of a raw transaction into success.
+
+        The node already holds this exact signed transaction (e.g. received
+        from another endpoint over p2p), so its hash is returned as the result.
+        """
+        error = response.get("error")
+        if error is None or "already known" not in str(error).lower():
+            return response
+        return {
+            "jsonrpc": "2.0",
+            "id": response.get("id"),
+            "result": Web3.to_hex(Web3.keccak(hexstr=params[0])),
+        }
+
+    def is_connected(self, show_traceback=False):
+        return any(
+            endpoint.provider.is_connected(show_traceback) for endpoint in self._endpoints
+        )
+
+    def stats(self):
+        """
+        Returns per-endpoint health statistics.
+
+        Returns:
+            list[dict]: One entry per endpoint, in configuration order.
+        """
+        now = time.monotonic()
+        with self._lock:
+            return [
+                {
+                    "endpoint": endpoint.name,
+                    "state": endpoint.state(now),
+                    "latency_ms": (
+                        round(endpoint.latency * 1000, 1)
+                        if endpoint.latency is not None
+                        else None
+                    ),
+                    "requests": endpoint.requests,
+                    "failures": endpoint.failures,
+                    "consecutive_failures": endpoint.consecutive_failures,
+                }
+                for endpoint in self._endpoints
+            ]
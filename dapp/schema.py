@@ -0,0 +1,117 @@
+from sqlalchemy import inspect, text
+
+from .db import database
+from .models import Candidate, Transaction, Vote, Voter
+
+
+def add_missing_columns():
+    """
+    Adds model columns that are missing from existing tables.
+
+    database.create_all() only creates missing tables, so databases created by
+    an older version of the app would lack newly added (nullable) columns.
+    """
+    inspector = inspect(database.engine)
+    existing_tables = inspector.get_table_names()
+
+    with database.engine.begin() as connection:
+        for table in database.metadata.sorted_tables:
+            if table.name not in existing_tables:
+                continue
+            existing_columns = {column["name"] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing_columns:
+                    continue
+                column_type = column.type.compile(dialect=database.engine.dialect)
+                connection.execute(
+                    text(f'ALTER TABLE "{table.name}" ADD COLUMN "{column.name}" {column_type}')
+                )
+                print(f"[schema] Added column {table.name}.{column.name}")
+
+
+def add_missing_indexes():
+    """
+    Creates model indexes that are missing from existing tables.
+
+    An index that cannot be built (e.g. a unique index over duplicate rows
+    left by an older version) is reported and skipped, so startup goes on.
+    """
+    inspector = inspect(database.engine)
+    existing_tables = inspector.get_table_names()
+
+    for table in database.metadata.sorted_tables:
+        if table.name not in existing_tables:
+            continue
+        existing_indexes = {index["name"] for index in inspector.get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name in existing_indexes:
+                continue
+            try:
+                with database.engine.begin() as connection:
+                    index.create(bind=connection)
+                print(f"[schema] Created index {index.name}")
+            except Exception as e:
+                print(f"[schema] Could not create index {index.name}: {e}")
+
+
+def _hot_queries():
+    """
+    Returns the off-chain queries run on request paths, by name.
+
+    Each must be served by an index; see find_full_scans().
+    """
+    return {
+        "fetch_votes_by_candidate_hash": Vote.query.filter_by(candidate_hash="0x"),
+        "upsert_votes": Vote.query.filter(Vote.voter_hash.in_(["0x"])),
+        "votes_by_position_and_voter": Vote.query.filter_by(position_id=1, voter_hash="0x"),
+        "votes_by_position": Vote.query.filter_by(position_id=1),
+        "fetch_candidate_by_hash": Candidate.query.filter_by(candidate_hash="0x"),
+        "fetch_candidates_by_hashes": Candidate.query.filter(
+            Candidate.candidate_hash.in_(["0x"])
+        ),
+        "fetch_candidate_by_position_id": Candidate.query.filter_by(position_id=1),
+        "is_wallet_address_already_exists": Voter.query.filter_by(wallet_address="0x"),
+        "fetch_all_transactions": Transaction.query.order_by(Transaction.txn_ts.desc()),
+    }
+
+
+def find_full_scans():
+    """
+    Runs EXPLAIN QUERY PLAN on the hot queries and returns those that scan a
+    whole table or sort in a temporary B-tree instead of using an index.
+
+    Only meaningful on SQLite; other databases return an empty list.
+
+    Returns:
+        list[tuple]: (query name, plan detail) for every offending step.
+    """
+    if database.engine.dialect.name != "sqlite":
+        return []
+
+    offenders = []
+    with database.engine.connect() as connection:
+        for name, query in _hot_queries().items():
+            sql = str(
+                query.statement.compile(
+                    dialect=database.engine.dialect, compile_kwargs={"literal_binds": True}
+                )
+            )
+            for row in connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}"):
+                detail = row[-1]
+                full_scan = detail.startswith("SCAN") and "USING" not in detail
+                if full_scan or "TEMP B-TREE" in detail:
+                    offenders.append((name, detail))
+    return offenders
+
+
+def upgrade_schema():
+    """
+    Brings an existing off-chain database up to date with the models, and
+    warns about hot queries that no longer use an index.
+
+    Must be called inside an application context, after database.create_all().
+    """
+    add_missing_columns()
+    add_missing_indexes()
+    for name, detail in find_full_scans():
+        print(f"[schema] WARNING: {name} is not using an index ({detail})")
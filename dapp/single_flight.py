@@ -0,0 +1,85 @@
+import threading
+
+
+class _InFlightCall:
+    """
+    A call being executed on behalf of every caller waiting for its key.
+    """
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent identical calls into one execution.
+
+    The first caller for a key runs the function; callers arriving with the
+    same key while it is in flight wait for it and get its result (or its
+    exception). Nothing is kept once the call returns, so this adds no
+    staleness on top of whatever the function itself returns.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self.executed = 0
+        self.shared = 0
+
+    def do(self, key, fn):
+        """
+        Runs fn() once per in-flight key and shares its outcome.
+
+        Args:
+            key (hashable): Identity of the call.
+            fn (callable): The call to run, without arguments.
+
+        Returns:
+            The value returned by fn().
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _InFlightCall()
+                self._calls[key] = call
+                self.executed += 1
+            else:
+                self.shared += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def stats(self):
+        """
+        Returns how many calls were executed and how many were saved.
+
+        Returns:
+            dict: {"executed", "saved", "in_flight"}.
+        """
+        with self._lock:
+            return {
+                "executed": self.executed,
+                "saved": self.shared,
+                "in_flight": len(self._calls),
+            }
+
+
+# Shared coalescer for chain reads in this process
+single_flight = SingleFlight()
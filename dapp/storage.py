@@ -0,0 +1,103 @@
+import os
+
+from sqlalchemy import event
+
+from .credentials import (
+    DB_MAX_OVERFLOW,
+    DB_POOL_RECYCLE,
+    DB_POOL_SIZE,
+    DB_POOL_TIMEOUT,
+    SQLITE_BUSY_TIMEOUT,
+    SQLITE_CACHE_SIZE,
+    SQLITE_MMAP_SIZE,
+)
+
+
+def database_uri(default_uri):
+    """
+    Returns the database URL: DATABASE_URL from the environment if set
+    (e.g. a PostgreSQL server), otherwise the bundled SQLite file.
+
+    Args:
+        default_uri (str): The SQLite URI used when no override is set.
+
+    Returns:
+        str: The SQLAlchemy database URI.
+    """
+    return os.getenv("DATABASE_URL") or default_uri
+
+
+def engine_options(uri):
+    """
+    Returns SQLAlchemy engine options for a database URI.
+
+    Every engine gets a sized connection pool. SQLite also gets a busy
+    timeout at the driver level and may be shared across the app's worker
+    threads; an in-memory SQLite database keeps SQLAlchemy's single
+    connection pool.
+
+    Args:
+        uri (str): The SQLAlchemy database URI.
+
+    Returns:
+        dict: Options for SQLALCHEMY_ENGINE_OPTIONS.
+    """
+    options = {"pool_pre_ping": True}
+    if uri.startswith("sqlite"):
+        options["connect_args"] = {
+            "timeout": SQLITE_BUSY_TIMEOUT / 1000,
+            "check_same_thread": False,
+        }
+        if ":memory:" in uri or uri.rstrip("/") == "sqlite:":
+            return options
+    options.update(
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_timeout=DB_POOL_TIMEOUT,
+        pool_recycle=DB_POOL_RECYCLE,
+    )
+    return options
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """
+    Tunes each new SQLite connection for concurrent readers and writers.
+
+    WAL lets readers run while a write is in progress; synchronous=NORMAL is
+    crash-safe under WAL and avoids an fsync per commit; busy_timeout makes a
+    writer wait for the lock instead of failing with "database is locked".
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute(f"PRAGMA busy_timeout={int(SQLITE_BUSY_TIMEOUT)}")
+    cursor.execute(f"PRAGMA cache_size={int(SQLITE_CACHE_SIZE)}")
+    cursor.execute(f"PRAGMA mmap_size={int(SQLITE_MMAP_SIZE)}")
+    cursor.close()
+
+
+def init_storage(app, default_uri):
+    """
+    Configures the database URI and engine options of the app.
+
+    Must be called before database.init_app(app).
+
+    Args:
+        app (Flask): The Flask application.
+        default_uri (str): The SQLite URI used when DATABASE_URL is not set.
+    """
+    uri = database_uri(default_uri)
+    app.config["SQLALCHEMY_DATABASE_URI"] = uri
+    app.config["SQLALCHEMY_ENGINE_OPTIONS"] = engine_options(uri)
+
+
+def install_sqlite_pragmas(engine):
+    """
+    Applies the SQLite pragmas on every connection the engine opens.
+    Does nothing for other databases.
+
+    Args:
+        engine (Engine): The app's SQLAlchemy engine.
+    """
+    if engine.dialect.name == "sqlite":
+        event.listen(engine, "connect", _set_sqlite_pragmas)
@@ -0,0 +1,125 @@
+import struct
+from array import array
+from functools import lru_cache
+
+from web3 import Web3
+
+# One ABI-encoded Vote (static tuple, five 32-byte words):
+# uint32 positionId | uint64 timestamp | address voterAdd | bytes32 voterHash | bytes32 candidateHash
+_VOTE_SIZE = 160
+_VOTE_FIELDS = "28xI24xQ12x20s32s32s"
+_HEADER_SIZE = 64  # Offset of the dynamic array + its length
+_CHUNK_VOTES = 1024  # Votes unpacked per struct call
+
+
+@lru_cache(maxsize=4)
+def _chunk_struct(votes):
+    """
+    Returns a precompiled struct unpacking `votes` consecutive Vote records.
+    """
+    return struct.Struct(">" + _VOTE_FIELDS * votes)
+
+
+class VoteColumns:
+    """
+    A decoded page of votes stored column by column.
+
+    Numbers live in typed arrays and hashes/addresses in one contiguous bytes
+    buffer each (fixed width), so a page costs a handful of objects however
+    many votes it holds.
+    """
+
+    __slots__ = (
+        "position_ids",
+        "timestamps",
+        "voter_addresses",
+        "voter_hashes",
+        "candidate_hashes",
+    )
+
+    def __init__(self, position_ids, timestamps, voter_addresses, voter_hashes, candidate_hashes):
+        """
+        Args:
+            position_ids (array): uint32 position IDs.
+            timestamps (array): uint64 vote timestamps.
+            voter_addresses (bytes): 20-byte voter addresses, concatenated.
+            voter_hashes (bytes): 32-byte voter hashes, concatenated.
+            candidate_hashes (bytes): 32-byte candidate hashes, concatenated.
+        """
+        self.position_ids = position_ids
+        self.timestamps = timestamps
+        self.voter_addresses = voter_addresses
+        self.voter_hashes = voter_hashes
+        self.candidate_hashes = candidate_hashes
+
+    def __len__(self):
+        return len(self.position_ids)
+
+    def iter_rows(self):
+        """
+        Yields Vote table rows lazily.
+
+        Hashes are hex-encoded one buffer at a time instead of per vote, and
+        each distinct address is checksummed once.
+
+        Yields:
+            tuple: (position_id, voter_hash, candidate_hash, date_time_ts, wallet_address).
+        """
+        voter_hex = self.voter_hashes.hex()
+        candidate_hex = self.candidate_hashes.hex()
+        addresses = memoryview(self.voter_addresses)
+        checksummed = {}
+
+        for i, (position_id, timestamp) in enumerate(zip(self.position_ids, self.timestamps)):
+            raw_address = bytes(addresses[i * 20:(i + 1) * 20])
+            address = checksummed.get(raw_address)
+            if address is None:
+                address = checksummed[raw_address] = Web3.to_checksum_address(raw_address)
+            yield (
+                position_id,
+                voter_hex[i * 64:(i + 1) * 64],
+                candidate_hex[i * 64:(i + 1) * 64],
+                timestamp,
+                address,
+            )
+
+
+def decode_votes(data):
+    """
+    Decodes the return data of getVotes() straight into columns.
+
+    Bypasses web3's contract layer (per-vote tuples and return normalizers):
+    votes are unpacked a chunk at a time by a precompiled struct and split
+    into columns by slicing.
+
+    Args:
+        data (bytes): Raw ABI-encoded Vote[] return data.
+
+    Returns:
+        VoteColumns: The decoded votes.
+    """
+    data = memoryview(data)
+    if len(data) < _HEADER_SIZE:
+        raise ValueError("Return data too short for a Vote[]")
+    count = int.from_bytes(data[32:_HEADER_SIZE], "big")
+    if len(data) < _HEADER_SIZE + count * _VOTE_SIZE:
+        raise ValueError(f"Return data too short for {count} votes")
+
+    position_ids, timestamps = array("I"), array("Q")
+    voter_addresses, voter_hashes, candidate_hashes = bytearray(), bytearray(), bytearray()
+    for start in range(0, count, _CHUNK_VOTES):
+        votes = min(_CHUNK_VOTES, count - start)
+        fields = _chunk_struct(votes).unpack_from(data, _HEADER_SIZE + start * _VOTE_SIZE)
+        position_ids.extend(fields[0::5])
+        timestamps.extend(fields[1::5])
+        voter_addresses += b"".join(fields[2::5])
+        voter_hashes += b"".join(fields[3::5])
+        candidate_hashes += b"".join(fields[4::5])
+
+    return VoteColumns(
+        position_ids,
+        timestamps,
+        bytes(voter_addresses),
+        bytes(voter_hashes),
+        bytes(candidate_hashes),
+    )
@@ -0,0 +1,157 @@
+import threading
+import time
+
+from web3 import Web3
+
+from .credentials import (
+    VOTE_INDEXER_BLOCK_RANGE,
+    VOTE_INDEXER_CONFIRMATIONS,
+    VOTE_INDEXER_ENABLED,
+    VOTE_INDEXER_POLL_INTERVAL,
+    VOTE_INDEXER_START_BLOCK,
+)
+from .db_operations import (
+    delete_reorged_votes,
+    fetch_indexer_checkpoint,
+    save_indexer_checkpoint,
+    upsert_votes,
+)
+from .election_config import election_config
+from .web3_client import client_registry
+
+
+class VoteIndexer:
+    """
+    Tails the contract's VoteCast logs into the off-chain Vote table.
+
+    Logs are read with eth_getLogs in bounded block ranges starting from a
+    checkpoint persisted in the database. Every scan re-reads the last
+    VOTE_INDEXER_CONFIRMATIONS blocks so votes whose block was reorged are
+    picked up again; votes are upserted on (position_id, voter_hash), so
+    re-reading is idempotent. Each vote keeps its block number and hash, and
+    votes in a re-read range whose logs are gone (block reorged out and not
+    re-included) are deleted.
+    """
+
+    _CHECKPOINT_NAME = "vote_cast"
+
+    def __init__(self):
+        self._app = None
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def init_app(self, app):
+        """
+        Binds the indexer to a Flask app and starts tailing if enabled and
+        the app runs background workers (see BACKGROUND_WORKERS).
+
+        Args:
+            app (Flask): The Flask application.
+        """
+        self._app = app
+        if (
+            VOTE_INDEXER_ENABLED
+            and app.config.get("BACKGROUND_WORKERS", True)
+            and self._thread is None
+        ):
+            self._thread = threading.Thread(
+                target=self._run, name="vote-indexer", daemon=True
+            )
+            self._thread.start()
+
+    def _decode_votes(self, contract_instance, logs):
+        """
+        Decodes VoteCast logs into Vote column mappings.
+
+        Args:
+            contract_instance (Contract): The EVoting contract.
+            logs (list): Raw logs returned by eth_getLogs.
+
+        Returns:
+            list[dict]: Vote column mappings.
+        """
+        votes = []
+        for log in logs:
+            args = contract_instance.events.VoteCast().process_log(log)["args"]
+            votes.append(
+                {
+                    "position_id": args["positionId"],
+                    "voter_hash": args["voterHash"].hex(),
+                    "candidate_hash": args["candidateHash"].hex(),
+                    "date_time_ts": args["timestamp"],
+                    "wallet_address": args["voterAdd"],
+                    "block_number": log["blockNumber"],
+                    "block_hash": Web3.to_hex(log["blockHash"]),
+                }
+            )
+        return votes
+
+    def catch_up(self):
+        """
+        Indexes every VoteCast log up to the latest block.
+
+        Must be called inside an application context.
+
+        Returns:
+            int: Number of vote logs processed.
+        """
+        with self._lock:
+            w3 = client_registry.w3
+            contract_instance = client_registry.contract(election_config.contract_address)
+            topic = contract_instance.events.VoteCast().topic
+            latest = w3.eth.block_number
+
+            checkpoint = fetch_indexer_checkpoint(self._CHECKPOINT_NAME)
+            if checkpoint is None:
+                # First run: start at the configured block, else the latest one;
+                # votes cast before that are backfilled from getVotes() at publish
+                checkpoint = (
+                    VOTE_INDEXER_START_BLOCK - 1
+                    if VOTE_INDEXER_START_BLOCK is not None
+                    else latest
+                )
+                save_indexer_checkpoint(self._CHECKPOINT_NAME, checkpoint)
+
+            from_block = max(checkpoint - VOTE_INDEXER_CONFIRMATIONS + 1, 0)
+            processed = 0
+            while from_block <= latest:
+                to_block = min(from_block + VOTE_INDEXER_BLOCK_RANGE - 1, latest)
+                logs = w3.eth.get_logs(
+                    {
+                        "address": contract_instance.address,
+                        "fromBlock": from_block,
+                        "toBlock": to_block,
+                        "topics": [topic],
+                    }
+                )
+                votes = self._decode_votes(contract_instance, logs)
+                upsert_votes(votes)
+                if from_block <= checkpoint:
+                    # Re-read blocks: drop votes whose block was reorged out
+                    removed = delete_reorged_votes(
+                        from_block,
+                        min(to_block, checkpoint),
+                        {(vote["position_id"], vote["voter_hash"]) for vote in votes},
+                    )
+                    if removed:
+                        print(f"[vote_indexer] Removed {removed} reorged votes")
+                save_indexer_checkpoint(self._CHECKPOINT_NAME, max(to_block, checkpoint))
+                processed += len(logs)
+                from_block = to_block + 1
+            return processed
+
+    def _run(self):
+        """
+        Background loop: catches up with the chain every poll interval.
+        """
+        while True:
+            try:
+                with self._app.app_context():
+                    self.catch_up()
+            except Exception as e:
+                print(f"[vote_indexer] Scan failed: {e}")
+            time.sleep(VOTE_INDEXER_POLL_INTERVAL)
+
+
+# Shared vote indexer, bound to the app in create_app()
+vote_indexer = VoteIndexer()
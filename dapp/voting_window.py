@@ -0,0 +1,96 @@
+import threading
+import time
+
+
+class VotingWindowCache:
+    """
+    In-process cache of the election's voting window.
+
+    The window only changes through setVotingTime / extendVotingTime, so it is
+    loaded from the chain once and then updated in place after those admin
+    transactions confirm. Alongside the window the cache keeps the latest block
+    timestamp seen at load time, which gives a local estimate of chain time for
+    "is voting open" checks without an RPC call.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._window = None  # (start_unix, end_unix)
+        self._block_timestamp = None
+        self._loaded_at = None
+
+    def get(self, loader):
+        """
+        Returns the cached voting window, loading it on first use.
+
+        Args:
+            loader (callable): Returns (start_unix, end_unix, block_timestamp)
+                from the chain; only called on a cache miss.
+
+        Returns:
+            tuple: (start_unix, end_unix).
+        """
+        window = self._window
+        if window is None:
+            with self._lock:
+                if self._window is None:
+                    start_unix, end_unix, block_timestamp = loader()
+                    self._window = (int(start_unix), int(end_unix))
+                    self._block_timestamp = int(block_timestamp)
+                    self._loaded_at = time.monotonic()
+                window = self._window
+        return window
+
+    def update(self, start_unix=None, end_unix=None):
+        """
+        Applies a confirmed setVotingTime / extendVotingTime to the cache.
+
+        Args:
+            start_unix (int): New start time, or None to keep the cached one.
+            end_unix (int): New end time, or None to keep the cached one.
+        """
+        with self._lock:
+            if self._window is None:
+                return  # Nothing cached yet; the next get() loads fresh values
+            start, end = self._window
+            self._window = (
+                int(start_unix) if start_unix is not None else start,
+                int(end_unix) if end_unix is not None else end,
+            )
+
+    def invalidate(self):
+        """
+        Drops the cached window; the next get() reloads it from the chain.
+        """
+        with self._lock:
+            self._window = None
+            self._block_timestamp = None
+            self._loaded_at = None
+
+    def estimated_chain_time(self):
+        """
+        Estimates the current block timestamp from the one seen at load time.
+
+        Returns:
+            int: Estimated chain time, or wall-clock time if nothing is cached.
+        """
+        if self._block_timestamp is None:
+            return int(time.time())
+        return self._block_timestamp + int(time.monotonic() - self._loaded_at)
+
+    def is_open(self, loader):
+        """
+        Checks whether voting is open using the cached window and chain-time estimate.
+
+        Args:
+            loader (callable): See get().
+
+        Returns:
+            bool: True if the estimated chain time is inside the window.
+        """
+        start_unix, end_unix = self.get(loader)
+        return start_unix < self.estimated_chain_time() < end_unix
+
+
+# Shared voting window cache for this process
+voting_window = VotingWindowCache()
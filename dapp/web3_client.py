@@ -0,0 +1,111 @@
+import json
+import os
+import threading
+
+from web3 import Web3
+
+from .credentials import WEB3_PROVIDER_URLS, WEB3_POOL_SIZE
+from .rpc_pool import MultiEndpointProvider
+
+
+class Web3ClientRegistry:
+    """
+    Process-wide registry of the Web3 client and contract objects.
+
+    Holds a single Web3 instance backed by a pool of JSON-RPC endpoints (each
+    with its own keep-alive HTTP session, see MultiEndpointProvider), the
+    contract ABI (read from disk once) and one contract object per contract
+    address. All lazy initialisation is guarded by a lock so the registry can be
+    shared between Flask worker threads.
+    """
+
+    _ABI_DIR = f"{os.getcwd()}/contract/ABI.json"
+
+    def __init__(self, provider_urls, pool_size=WEB3_POOL_SIZE):
+        """
+        Initializes an empty registry; connections are created on first use.
+
+        Args:
+            provider_urls (list): JSON-RPC endpoints of the Ethereum nodes.
+            pool_size (int): Maximum pooled keep-alive connections per endpoint.
+        """
+        self._provider_urls = list(provider_urls)
+        self._pool_size = pool_size
+        self._lock = threading.RLock()
+        self._w3 = None
+        self._abi = None
+        self._contracts = {}
+
+    @property
+    def w3(self):
+        """
+        Returns the shared Web3 instance, creating it on first access.
+
+        Returns:
+            Web3: The shared Web3 client.
+        """
+        if self._w3 is None:
+            with self._lock:
+                if self._w3 is None:
+                    self._w3 = Web3(
+                        MultiEndpointProvider(self._provider_urls, self._pool_size)
+                    )
+        return self._w3
+
+    def provider_stats(self):
+        """
+        Returns latency, failure and circuit breaker statistics per endpoint.
+
+        Returns:
+            list[dict]: See MultiEndpointProvider.stats().
+        """
+        return self.w3.provider.stats()
+
+    @property
+    def abi(self):
+        """
+        Returns the contract ABI, reading ABI.json only once per process.
+
+        Returns:
+            list: The parsed contract ABI.
+        """
+        if self._abi is None:
+            with self._lock:
+                if self._abi is None:
+                    with open(self._ABI_DIR) as ABI_file:
+                        self._abi = json.loads(ABI_file.read())
+        return self._abi
+
+    def contract(self, contract_address):
+        """
+        Returns the cached contract object for an address, building it once.
+
+        Args:
+            contract_address (str): The deployed contract address.
+
+        Returns:
+            Contract: The web3 contract instance.
+        """
+        contract_instance = self._contracts.get(contract_address)
+        if contract_instance is None:
+            with self._lock:
+                contract_instance = self._contracts.get(contract_address)
+                if contract_instance is None:
+                    contract_instance = self.w3.eth.contract(
+                        abi=self.abi, address=contract_address
+                    )
+                    self._contracts[contract_address] = contract_instance
+        return contract_instance
+
+    def reset(self):
+        """
+        Drops the cached client, ABI and contracts (e.g. after a redeploy).
+        """
+        with self._lock:
+            self._w3 = None
+            self._abi = None
+            self._contracts = {}
+
+
+# Shared registry used by every Blockchain instance in this process
+client_registry = Web3ClientRegistry(WEB3_PROVIDER_URLS)
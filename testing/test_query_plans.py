@@ -0,0 +1,33 @@
+"""
+Checks that every hot off-chain query is served by an index.
+
+Builds the schema in an in-memory SQLite database and runs
+schema.find_full_scans() over it.
+
+Run from the repository root:
+    python -m pytest testing/test_query_plans.py
+"""
+import pytest
+from flask import Flask
+
+from dapp import models  # noqa: F401  (registers the tables)
+from dapp.db import database
+from dapp.schema import find_full_scans
+from dapp.storage import engine_options
+
+
+@pytest.fixture
+def app():
+    app = Flask(__name__)
+    # Set directly so a DATABASE_URL in the environment is never touched
+    app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite://"
+    app.config["SQLALCHEMY_ENGINE_OPTIONS"] = engine_options("sqlite://")
+    database.init_app(app)
+    with app.app_context():
+        database.create_all()
+        yield app
+        database.drop_all()
+
+
+def test_hot_queries_use_indexes(app):
+    assert find_full_scans() == []
@@ -0,0 +1,87 @@
+"""
+Benchmark: decoding getVotes() return data for the off-chain Vote table.
+
+Compares web3's contract-layer path (eth_abi decode + return normalizers,
+then one mapping per vote with .hex() on every hash, as the former ORM bulk insert did)
+against vote_codec.decode_votes() + VoteColumns.iter_rows().
+
+Run from the repository root:
+    python testing/web3/bench_vote_decode.py [10000 100000 1000000]
+"""
+import os
+import struct
+import sys
+import time
+
+sys.path.insert(0, os.getcwd())
+
+from eth_abi import decode
+from web3._utils.abi import map_abi_data
+from web3._utils.normalizers import BASE_RETURN_NORMALIZERS
+
+from dapp.vote_codec import decode_votes
+
+VOTE_TYPES = ["(uint32,uint64,address,bytes32,bytes32)[]"]
+VOTERS = 1000  # distinct voter wallets in the synthetic election
+
+
+def encode_votes(count):
+    """
+    Builds ABI-encoded Vote[] return data without going through eth_abi,
+    which would dominate the run time at 1M votes.
+    """
+    record = struct.Struct(">28xI24xQ12x20s32s32s")
+    body = bytearray()
+    for i in range(count):
+        body += record.pack(
+            i % 8 + 1,
+            1700000000 + i,
+            (i % VOTERS).to_bytes(20, "big"),
+            i.to_bytes(32, "big"),
+            (i % 8).to_bytes(32, "big"),
+        )
+    return (32).to_bytes(32, "big") + count.to_bytes(32, "big") + bytes(body)
+
+
+def web3_path(data):
+    (votes,) = map_abi_data(BASE_RETURN_NORMALIZERS, VOTE_TYPES, decode(VOTE_TYPES, data))
+    return [
+        {
+            "position_id": position_id,
+            "voter_hash": voter_hash.hex(),
+            "candidate_hash": candidate_hash.hex(),
+            "date_time_ts": date_time_ts,
+            "wallet_address": wallet_address,
+        }
+        for position_id, date_time_ts, wallet_address, voter_hash, candidate_hash in votes
+    ]
+
+
+def columnar_path(data):
+    return decode_votes(data).iter_rows()
+
+
+def timed(fn, data):
+    started = time.perf_counter()
+    rows = fn(data)
+    count = sum(1 for _ in rows)  # Consume lazy rows as the DB writer would
+    return time.perf_counter() - started, count
+
+
+def main(sizes):
+    # Both paths must produce the same rows
+    sample = encode_votes(100)
+    expected = [tuple(row.values()) for row in web3_path(sample)]
+    assert list(columnar_path(sample)) == expected, "decoders disagree"
+
+    print(f"{'votes':>10} {'web3 (s)':>10} {'columns (s)':>12} {'speedup':>8}")
+    for size in sizes:
+        data = encode_votes(size)
+        web3_time, _ = timed(web3_path, data)
+        columns_time, count = timed(columnar_path, data)
+        assert count == size
+        print(f"{size:>10} {web3_time:>10.2f} {columns_time:>12.2f} {web3_time / columns_time:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [10_000, 100_000, 1_000_000])